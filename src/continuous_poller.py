@@ -24,10 +24,8 @@ from src.metrics import (
 )
 from src.circuit_breaker import with_circuit_breaker
 from src.utils import (
-    scrape_upwork_data,
-    score_scaped_jobs,
-    generate_cover_letter,
-    generate_interview_script_content,
+    scrape_and_score_upwork_data,
+    generate_application_bundle,
     scrape_job_questions,
     generate_question_answers,
     setup_logger,
@@ -102,6 +100,8 @@ class UpworkPoller:
         self.max_jobs_per_poll = max_jobs_per_poll
         self.job_retention_days = job_retention_days
         self.webhook_url = webhook_url
+        # Keep-alive session so repeated webhooks reuse one connection
+        self.http_session = requests.Session()
         self.high_value_threshold = high_value_threshold
         self.job_tracker = JobTracker()
         self.running = False
@@ -219,7 +219,7 @@ class UpworkPoller:
                 }
             
                 logger.debug(f"Sending webhook to URL: {self.webhook_url}")
-                response = requests.post(
+                response = self.http_session.post(
                     self.webhook_url,
                     json=payload,
                     headers={"Content-Type": "application/json"},
@@ -246,7 +246,8 @@ class UpworkPoller:
         """Process a single job and return the result"""
         try:
             logger.debug(f"Starting to process job {job_id}")
-            logger.debug(f"Job data structure: {truncate_content(str(job_data))}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Job data structure: {truncate_content(str(job_data))}")
             
             JOBS_PROCESSED.inc()
             
@@ -261,25 +262,15 @@ class UpworkPoller:
             }
             
             # Only generate content for high-value jobs
-            if job_data.get("score", 0) >= self.high_value_threshold:
+            if (job_data.get("score") or 0) >= self.high_value_threshold:
                 HIGH_VALUE_JOBS.inc()
                 logger.info(f"High-value job found: {job_id} (score: {job_data.get('score')})")
                 
-                # Generate cover letter
-                logger.debug(f"Generating cover letter for job {job_id}")
-                cover_letter_response = generate_cover_letter(
-                    job_data["description"],
-                    self.profile
-                )
-                cover_letter = cover_letter_response.get("letter", "") if isinstance(cover_letter_response, dict) else str(cover_letter_response)
-                result["cover_letter"] = cover_letter
-                
-                # Generate interview script
-                script_response = generate_interview_script_content(
-                    job_data["description"]
-                )
-                interview_script = script_response.get("script", "") if isinstance(script_response, dict) else str(script_response)
-                result["interview_script"] = interview_script
+                # Cover letter and interview script come back from a single Gemini call
+                logger.debug(f"Generating cover letter and interview script for job {job_id}")
+                bundle = generate_application_bundle(job_data["description"], self.profile)
+                result["cover_letter"] = bundle.get("letter", "")
+                result["interview_script"] = bundle.get("script", "")
                 
                 # Send webhook notification with current search config
                 self._send_webhook_notification(job_data, result, search_config)
@@ -319,27 +310,27 @@ class UpworkPoller:
                     time.sleep(self.poll_interval)
                     continue
 
-                # Scrape latest jobs
+                # Scrape latest jobs, scoring each batch while the next one is scraped
                 logger.debug(f"Polling for new jobs with config: {search_config}")
                 with MetricsTimer(API_LATENCY, {"api_type": "scraper"}):
-                    jobs_df = scrape_upwork_data(
+                    scored_jobs = scrape_and_score_upwork_data(
                         search_config,
+                        self.profile,
                         self.max_jobs_per_poll
                     )
-                    if not jobs_df.empty:
-                        JOBS_SCRAPED.inc(len(jobs_df))
+                    if not scored_jobs.empty:
+                        JOBS_SCRAPED.inc(len(scored_jobs))
                 
-                if jobs_df.empty:
+                if scored_jobs.empty:
                     logger.debug(f"No new jobs found for current search, rotating to next...")
                     continue
                 
-                # Score jobs
-                scored_jobs = score_scaped_jobs(jobs_df, self.profile)
                 logger.debug(f"Scored jobs DataFrame: {scored_jobs.columns.tolist()}")
                 
                 try:
                     # Process new jobs
                     logger.debug("Starting to process new jobs...")
+                    new_jobs = []
                     for _, job in scored_jobs.iterrows():
                         # Convert job row to dictionary
                         job_data = job.to_dict()
@@ -349,10 +340,12 @@ class UpworkPoller:
                             logger.debug(f"Job already seen, skipping: {truncate_content(job_data['title'])}")
                             continue
                         
-                        # Mark as seen and get assigned job ID
                         logger.debug(f"Marking job as seen: {truncate_content(job_data['title'])}")
-                        job_id = self.job_tracker.mark_job_seen(job_data)
-                        logger.debug(f"Assigned job ID: {job_id}")
+                        new_jobs.append(job_data)
+                    
+                    # Mark the round's new jobs as seen in one write
+                    job_ids = self.job_tracker.mark_jobs_seen(new_jobs)
+                    logger.debug(f"Assigned job IDs: {job_ids}")
                     
                     # Process unprocessed jobs
                     logger.debug("Getting unprocessed jobs...")
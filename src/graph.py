@@ -1,15 +1,18 @@
+import sys
+import logging
 import pandas as pd
-from datetime import datetime
 from langgraph.graph import END, StateGraph
 from typing_extensions import TypedDict
 from typing import List
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from colorama import Fore, Style
 from .utils import (
     scrape_upwork_data,
     score_scaped_jobs,
     convert_jobs_matched_to_string_list,
-    generate_cover_letter,
-    generate_interview_script_content,
+    generate_application_bundle,
+    GEMINI_CONCURRENCY,
     save_scraped_jobs_to_csv,
     setup_logger,
     truncate_content,
@@ -21,6 +24,38 @@ logger = setup_logger('graph')
 
 COVER_LETTERS_FILE = "./files/cover_letter.txt"
 
+# Columns every scraped jobs DataFrame is normalised to
+JOB_COLUMNS = [
+    "job_id",
+    "title",
+    "description",
+    "job_type",
+    "experience_level",
+    "duration",
+    "rate",
+    "client_infomation"
+]
+
+# Arrow-backed string dtype used for the scraped text columns
+STRING_DTYPE = "string[pyarrow]"
+
+# Pre-rendered console messages (the trailing newline matches print())
+_MSG_RUNNING = f"{Fore.BLUE}----- Running Upwork Jobs Automation -----\n{Style.RESET_ALL}\n"
+_MSG_SCRAPING = f"{Fore.YELLOW}----- Scraping Upwork jobs for: {{}} -----\n{Style.RESET_ALL}\n"
+_MSG_SCRAPED = f"{Fore.GREEN}----- Scraped {{}} jobs -----\n{Style.RESET_ALL}\n"
+_MSG_SCORING = f"{Fore.YELLOW}----- Scoring scraped jobs -----\n{Style.RESET_ALL}\n"
+_MSG_CHECKING = f"{Fore.YELLOW}----- Checking for remaining job matches -----\n{Style.RESET_ALL}\n"
+_MSG_NO_MATCHES = f"{Fore.RED}No job matches remaining\n{Style.RESET_ALL}\n"
+_MSG_MATCHES_REMAINING = f"{Fore.GREEN}There are {{}} Job matches remaining to process\n{Style.RESET_ALL}\n"
+_MSG_APPLICATION_CONTENT = f"{Fore.YELLOW}----- Generating cover letter and call script -----\n{Style.RESET_ALL}\n"
+_MSG_SCRAPING_QUESTIONS = f"{Fore.YELLOW}----- Scraping application questions -----\n{Style.RESET_ALL}\n"
+_MSG_QUESTIONS_FOUND = f"{Fore.GREEN}Found {{}} additional questions\n{Style.RESET_ALL}\n"
+_MSG_NO_QUESTIONS = f"{Fore.YELLOW}No additional questions found\n{Style.RESET_ALL}\n"
+_MSG_ANSWERING = f"{Fore.YELLOW}----- Generating answers for questions -----\n{Style.RESET_ALL}\n"
+_MSG_ANSWERS_GENERATED = f"{Fore.GREEN}Generated {{}} answers\n{Style.RESET_ALL}\n"
+_MSG_ANSWERS_FAILED = f"{Fore.RED}Failed to generate answers\n{Style.RESET_ALL}\n"
+_MSG_SAVING = f"{Fore.YELLOW}----- Saving application content -----\n{Style.RESET_ALL}\n"
+
 class GraphState(TypedDict):
     job_title: str
     scraped_jobs_df: pd.DataFrame
@@ -32,10 +67,15 @@ class GraphState(TypedDict):
     questions: List[dict]  # Store scraped questions
     answers: List[dict]    # Store generated answers
     apply_url: str        # Store the apply URL for the current job
+    jobs_saved: bool      # Whether scraped jobs have been written to CSV
+    bundles: dict         # Pre-generated {letter, script} per match description
 
 class UpworkAutomation:
-    def __init__(self, profile, num_jobs=20):
+    def __init__(self, profile, num_jobs=20, verbose=True):
         logger.info("Initializing UpworkAutomation")
+        # Whether to echo progress messages to the console
+        self.verbose = verbose
+
         # Freelancer profile/resume
         self.profile = profile
         logger.debug(f"Freelancer profile: {truncate_content(profile)}")
@@ -45,9 +85,15 @@ class UpworkAutomation:
         logger.debug(f"Number of jobs to collect: {num_jobs}")
 
         # Build graph
-        self.graph = self.build_graph()
+        # Graph topology is profile-independent, so the compiled graph is shared
+        self.graph = _build_compiled_graph(_NODE_NAMES)
         logger.info("UpworkAutomation initialized")
 
+    def _echo(self, message):
+        """Write a pre-rendered progress message to stdout (flushed in run())"""
+        if self.verbose:
+            sys.stdout.write(message)
+
     def scrape_upwork_jobs(self, state):
         """
         Scrape jobs based on job title provided
@@ -58,11 +104,7 @@ class UpworkAutomation:
         logger.info(f"Scraping Upwork jobs for: {state['job_title']}")
         job_title = state["job_title"]
 
-        print(
-            Fore.YELLOW
-            + f"----- Scraping Upwork jobs for: {job_title} -----\n"
-            + Style.RESET_ALL
-        )
+        self._echo(_MSG_SCRAPING.format(job_title))
         
         # Ensure we have a job title before scraping
         if not job_title:
@@ -76,45 +118,31 @@ class UpworkAutomation:
         elif len(job_listings_df) > self.number_of_jobs:
             job_listings_df = job_listings_df.head(self.number_of_jobs)
         
-        # Ensure DataFrame has expected columns and structure
-        expected_columns = [
-            "job_id",
-            "title",
-            "description",
-            "job_type",
-            "experience_level",
-            "duration",
-            "rate",
-            "client_infomation"
-        ]
-        
         # Create new DataFrame with expected columns and types
         if not job_listings_df.empty:
             # Ensure all expected columns exist
-            for col in expected_columns:
+            for col in JOB_COLUMNS:
                 if col not in job_listings_df.columns:
                     job_listings_df[col] = None
             
-            # Reorder columns to match expected structure
-            job_listings_df = job_listings_df[expected_columns]
-            
-            # Convert job_id to string type if it exists
-            if "job_id" in job_listings_df.columns:
-                job_listings_df["job_id"] = job_listings_df["job_id"].astype(str)
+            # Reorder columns to match expected structure and store text
+            # columns as Arrow-backed strings for faster column operations.
+            # Missing values become "" first: pd.NA can't be JSON-encoded for
+            # scoring and would print as "<NA>" in the matched job text
+            job_listings_df = job_listings_df[JOB_COLUMNS].fillna("").astype(
+                {col: STRING_DTYPE for col in JOB_COLUMNS}
+            )
             
-        logger.debug(f"Scraped job listings: {truncate_content(str(job_listings_df))}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Scraped job listings: %s", truncate_content(job_listings_df.head(3).to_string()))
 
-        print(
-            Fore.GREEN
-            + f"----- Scraped {len(job_listings_df)} jobs -----\n"
-            + Style.RESET_ALL
-        )
+        self._echo(_MSG_SCRAPED.format(len(job_listings_df)))
         logger.info(f"Scraped {len(job_listings_df)} jobs")
         
         # Return new state with scraped jobs
         return {
             **state,
-            "scraped_jobs_df": job_listings_df if not job_listings_df.empty else pd.DataFrame(columns=expected_columns)
+            "scraped_jobs_df": job_listings_df if not job_listings_df.empty else pd.DataFrame(columns=JOB_COLUMNS)
         }
 
     def score_scraped_jobs(self, state):
@@ -125,7 +153,7 @@ class UpworkAutomation:
         @return: Updated state with scored jobs and matches.
         """
         logger.info("Scoring scraped jobs")
-        print(Fore.YELLOW + "----- Scoring scraped jobs -----\n" + Style.RESET_ALL)
+        self._echo(_MSG_SCORING)
         
         # Get the jobs DataFrame from state
         jobs_df = state.get("scraped_jobs_df", pd.DataFrame())
@@ -161,7 +189,8 @@ class UpworkAutomation:
         jobs_matched = scored_df[scored_df["score"] >= 7]
         matches = convert_jobs_matched_to_string_list(jobs_matched)
         
-        logger.debug(f"Matched jobs: {matches}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Matched jobs: %s", truncate_content(matches))
         logger.info("Scoring of scraped jobs completed")
         
         # Return updated state
@@ -180,21 +209,23 @@ class UpworkAutomation:
         @return: Updated state with initialized fields if needed.
         """
         logger.info("Checking for remaining job matches")
-        print(
-            Fore.YELLOW
-            + "----- Checking for remaining job matches -----\n"
-            + Style.RESET_ALL
-        )
+        self._echo(_MSG_CHECKING)
 
         # Initialize state fields if they don't exist
         updated_state = {
             **state,
-            "matches": state.get("matches", []),
+            "matches": state.get("matches") or [],
             "job_description": state.get("job_description", ""),
             "cover_letter": state.get("cover_letter", ""),
             "call_script": state.get("call_script", "")
         }
 
+        # Persist the scraped jobs once, when there is nothing left to process
+        if not updated_state["matches"] and not state.get("jobs_saved"):
+            if "scraped_jobs_df" in state:
+                save_scraped_jobs_to_csv(state["scraped_jobs_df"])
+            updated_state["jobs_saved"] = True
+
         logger.info("Finished checking for remaining job matches")
         return updated_state
 
@@ -207,60 +238,61 @@ class UpworkAutomation:
         """
         logger.info("Checking if there are any job matches")
         
-        # Get matches from state with safe access
-        matches = state.get("matches", [])
-        if matches is None:
-            matches = []
-            
-        if len(matches) == 0:
+        # Get matches from state with safe access (None is treated as empty)
+        matches = state.get("matches")
+        if not matches:
             logger.info("No job matches remaining")
-            print(Fore.RED + "No job matches remaining\n" + Style.RESET_ALL)
-            save_scraped_jobs_to_csv(state.get("scraped_jobs_df", pd.DataFrame()))
+            self._echo(_MSG_NO_MATCHES)
             return "No matches"
         else:
             logger.info(f"There are {len(matches)} Job matches remaining to process")
-            print(
-                Fore.GREEN
-                + f"There are {len(matches)} Job matches remaining to process\n"
-                + Style.RESET_ALL
-            )
+            self._echo(_MSG_MATCHES_REMAINING.format(len(matches)))
             return "Process jobs"
 
     def generate_job_application_content(self, state):
         """
-        Initialize state for job application content generation.
+        Generate the documents for all pending matches and reset the per-job fields.
 
         @param state: The current state of the application.
-        @return: Updated state with initialized fields for content generation.
+        @return: Updated state with generated bundles and initialized fields for content generation.
         """
         logger.info("Generating job application content")
         
+        # Generate every pending match's documents at once; the LLM calls are network-bound
+        bundles = state.get("bundles") or {}
+        pending = list(dict.fromkeys(str(match) for match in state.get("matches") or [] if str(match) not in bundles))
+        if pending:
+            with ThreadPoolExecutor(max_workers=GEMINI_CONCURRENCY) as executor:
+                generated = executor.map(lambda job: generate_application_bundle(job, self.profile), pending)
+                bundles = {**bundles, **dict(zip(pending, generated))}
+        
         # Initialize state for content generation
         updated_state = {
             **state,
-            "job_description": "",  # Will be set by generate_cover_letter
-            "cover_letter": "",     # Will be set by generate_cover_letter
-            "call_script": ""       # Will be set by generate_interview_script_content
+            "bundles": bundles,
+            "job_description": "",  # Set by generate_cover_letter_and_script
+            "cover_letter": "",     # Set by generate_cover_letter_and_script
+            "call_script": ""       # Set by generate_cover_letter_and_script
         }
         
         logger.info("Job application content state initialized")
         return updated_state
 
-    def generate_cover_letter(self, state):
+    def generate_cover_letter_and_script(self, state):
         """
-        Generate cover letter based on the job description and the profile.
+        Generate the cover letter and interview script for the current job in one LLM call.
 
         @param state: The current state of the application.
-        @return: Updated state with generated cover letter and apply URL.
+        @return: Updated state with generated cover letter, call script and apply URL.
         """
-        logger.info("Generating cover letter")
-        print(Fore.YELLOW + "----- Generating cover letter -----\n" + Style.RESET_ALL)
+        logger.info("Generating cover letter and interview script")
+        self._echo(_MSG_APPLICATION_CONTENT)
         
         # Get current job from matches
         matches = state["matches"]
         if not matches:
             logger.warning("No job data found in matches")
-            return {**state, "cover_letter": "", "job_description": "", "apply_url": ""}
+            return {**state, "cover_letter": "", "call_script": "", "job_description": "", "apply_url": ""}
             
         # Get job data from DataFrame using the last match
         jobs_df = state.get("scraped_jobs_df", pd.DataFrame())
@@ -275,52 +307,38 @@ class UpworkAutomation:
                 apply_url = job_row.iloc[0].get("apply_url", "")
                 logger.debug(f"Found apply URL: {apply_url}")
         
-        # Generate cover letter
-        cover_letter_response = generate_cover_letter(current_job, self.profile)
-        cover_letter = cover_letter_response.get("letter", "") if isinstance(cover_letter_response, dict) else str(cover_letter_response)
+        # Both documents share the job description, so one request produces them together
+        bundle = (state.get("bundles") or {}).get(current_job)
+        if bundle is None:
+            bundle = generate_application_bundle(current_job, self.profile)
+        if not isinstance(bundle, dict):
+            bundle = {"letter": str(bundle), "script": ""}
+        cover_letter = bundle.get("letter", "")
+        call_script = bundle.get("script", "")
         
         # Ensure letter starts with "Hello" if it doesn't already
         if not cover_letter.startswith("Hello"):
             cover_letter = "Hello, " + cover_letter
             
-        logger.debug(f"Generated cover letter: {truncate_content(cover_letter)}")
-        logger.info("Cover letter generated")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated cover letter: %s", truncate_content(cover_letter))
+            logger.debug("Generated call script: %s", truncate_content(call_script))
+        logger.info("Cover letter and interview script generated")
         
         return {
             **state,  # Preserve other state first
             "job_description": current_job,
             "cover_letter": cover_letter,
+            "call_script": call_script,
             "apply_url": apply_url
         }
 
-    def generate_interview_script_content(self, state):
-        """
-        Generate interview script content based on the job description.
-
-        @param state: The current state of the application.
-        @return: Updated state with generated interview script.
-        """
-        logger.info("Generating interview script content")
-        print(Fore.YELLOW + "----- Generating call script -----\n" + Style.RESET_ALL)
-        matches = state["matches"]
-        job_description = str(matches[-1])
-        # Generate interview script by calling the function with job description
-        script_response = generate_interview_script_content(str(job_description))
-        call_script = script_response.get("script", "") if isinstance(script_response, dict) else str(script_response)
-            
-        logger.debug(f"Generated call script: {truncate_content(call_script)}")
-        logger.info("Interview script content generated")
-        return {
-            **state,  # Preserve other state first
-            "call_script": call_script
-        }
-
     def scrape_application_questions(self, state):
         """
         Scrape questions from the job application page if they exist.
         """
         logger.info("Scraping application questions")
-        print(Fore.YELLOW + "----- Scraping application questions -----\n" + Style.RESET_ALL)
+        self._echo(_MSG_SCRAPING_QUESTIONS)
         
         apply_url = state.get("apply_url", "")
         if not apply_url:
@@ -332,10 +350,10 @@ class UpworkAutomation:
         
         if questions:
             logger.info(f"Found {len(questions)} questions")
-            print(Fore.GREEN + f"Found {len(questions)} additional questions\n" + Style.RESET_ALL)
+            self._echo(_MSG_QUESTIONS_FOUND.format(len(questions)))
         else:
             logger.info("No additional questions found")
-            print(Fore.YELLOW + "No additional questions found\n" + Style.RESET_ALL)
+            self._echo(_MSG_NO_QUESTIONS)
             
         return {**state, "questions": questions}
         
@@ -344,61 +362,62 @@ class UpworkAutomation:
         Generate answers for application questions if they exist.
         """
         logger.info("Generating answers for application questions")
-        print(Fore.YELLOW + "----- Generating answers for questions -----\n" + Style.RESET_ALL)
+        self._echo(_MSG_ANSWERING)
         
         questions = state.get("questions", [])
         if not questions:
             logger.info("No questions to answer")
             return {**state, "answers": []}
             
-        # Get current job data from matches
+        # Get current job data, reusing the description set by generate_cover_letter_and_script
         matches = state["matches"]
         if not matches:
             logger.warning("No job data found in matches")
             return {**state, "answers": []}
             
-        job_data = {"description": str(matches[-1])}
+        job_data = {"description": state.get("job_description") or str(matches[-1])}
         
         answers_response = generate_question_answers(job_data, questions)
         answers = answers_response.get("answers", [])
         
         if answers:
             logger.info(f"Generated {len(answers)} answers")
-            print(Fore.GREEN + f"Generated {len(answers)} answers\n" + Style.RESET_ALL)
+            self._echo(_MSG_ANSWERS_GENERATED.format(len(answers)))
         else:
             logger.warning("Failed to generate answers")
-            print(Fore.RED + "Failed to generate answers\n" + Style.RESET_ALL)
+            self._echo(_MSG_ANSWERS_FAILED)
             
         return {**state, "answers": answers}
 
     def save_job_application_content(self, state):
         logger.info("Saving job application content")
-        print(Fore.YELLOW + "----- Saving application content -----\n" + Style.RESET_ALL)
+        self._echo(_MSG_SAVING)
         
-        # Get the current timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Assemble the whole document first so the file gets a single write
+        parts = [
+            "# Job Description\n\n", state.get("job_description", ""), "\n\n",
+            "# Cover Letter\n\n", state.get("cover_letter", ""), "\n\n",
+        ]
         
-        with open(COVER_LETTERS_FILE, "w") as file:
-            # Write the cover letter
-            file.write("# Cover Letter\n\n")
-            file.write(state.get("cover_letter", "") + "\n\n")
-            
-            # Write answers to questions if they exist
-            questions = state.get("questions", [])
-            answers = state.get("answers", [])
-            if questions and answers:
-                file.write("# Additional Questions\n\n")
-                for q, a in zip(questions, answers):
-                    file.write(f"Q: {q.get('text', '')}\n")
-                    file.write(f"A: {a.get('answer', '')}\n\n")
-            
-            # Write the interview script
-            file.write("# Interview Script\n\n")
-            file.write(state.get("call_script", ""))
+        # Add answers to questions if they exist
+        questions = state.get("questions", [])
+        answers = state.get("answers", [])
+        if questions and answers:
+            parts.append("# Additional Questions\n\n")
+            for q, a in zip(questions, answers):
+                parts.append(f"Q: {q.get('text', '')}\nA: {a.get('answer', '')}\n\n")
+        
+        # Add the interview script
+        parts.append("# Interview Script\n\n")
+        parts.append(state.get("call_script", ""))
+        parts.append("\n\n")
+        
+        # Append, so every processed match keeps its application in the file
+        with open(COVER_LETTERS_FILE, "a") as file:
+            file.write("".join(parts))
             
-        # Remove already processed job
-        matches = state["matches"].copy()
-        matches.pop()
+        # Remove already processed job (slicing makes the shallow copy in one step)
+        matches = state["matches"][:-1]
         
         logger.info("Job application content saved")
         return {
@@ -409,54 +428,9 @@ class UpworkAutomation:
             "apply_url": ""   # Clear apply URL for next job
         }
 
-    def build_graph(self):
-        logger.info("Building graph")
-        graph = StateGraph(GraphState)
-
-        # Create all required nodes
-        graph.add_node("scrape_upwork_jobs", self.scrape_upwork_jobs)
-        graph.add_node("score_scraped_jobs", self.score_scraped_jobs)
-        graph.add_node("check_for_job_matches", self.check_for_job_matches)
-        graph.add_node("generate_job_application_content", self.generate_job_application_content)
-        graph.add_node("generate_cover_letter", self.generate_cover_letter)
-        graph.add_node("scrape_application_questions", self.scrape_application_questions)
-        graph.add_node("generate_question_answers", self.generate_question_answers)
-        graph.add_node("generate_interview_script_content", self.generate_interview_script_content)
-        graph.add_node("save_job_application_content", self.save_job_application_content)
-
-        # Link nodes to complete workflow
-        graph.set_entry_point("scrape_upwork_jobs")
-        graph.add_edge("scrape_upwork_jobs", "score_scraped_jobs")
-        graph.add_edge("score_scraped_jobs", "check_for_job_matches")
-        graph.add_conditional_edges(
-            "check_for_job_matches",
-            self.need_to_process_matches,
-            {"Process jobs": "generate_job_application_content", "No matches": END},
-        )
-        # Create sequential flow to avoid concurrent updates
-        graph.add_edge("generate_job_application_content", "generate_cover_letter")
-        graph.add_edge("generate_cover_letter", "scrape_application_questions")
-        graph.add_edge("scrape_application_questions", "generate_question_answers")
-        graph.add_edge("generate_question_answers", "generate_interview_script_content")
-        graph.add_edge("generate_interview_script_content", "save_job_application_content")
-        graph.add_edge("save_job_application_content", "check_for_job_matches")
-        logger.info("Graph built")
-        return graph.compile()
-
-    def run(self, job_title):
-        """
-        Run the Upwork automation workflow with proper state initialization.
-
-        @param job_title: The job title to search for.
-        @return: The final state after workflow completion.
-        """
-        logger.info("Running Upwork Jobs Automation")
-        print(
-            Fore.BLUE + "----- Running Upwork Jobs Automation -----\n" + Style.RESET_ALL
-        )
-
-        # Initialize all required state fields
-        initial_state = {
+    def _initial_state(self, job_title):
+        """Build a state with every field the graph nodes expect"""
+        return {
             "job_title": job_title,
             "scraped_jobs_df": pd.DataFrame(),
             "matches": [],
@@ -466,10 +440,77 @@ class UpworkAutomation:
             "num_matches": 0,
             "questions": [],
             "answers": [],
-            "apply_url": ""
+            "apply_url": "",
+            "jobs_saved": False,
+            "bundles": {}
         }
 
-        config = {"recursion_limit": 1000}
-        state = self.graph.invoke(initial_state, config)
+    def _run_config(self):
+        """Graph run config; nodes dispatch to this instance through it"""
+        return {"recursion_limit": 1000, "configurable": {"automation": self}}
+
+    def run(self, job_title):
+        """
+        Run the Upwork automation workflow with proper state initialization.
+
+        @param job_title: The job title to search for.
+        @return: The final state after workflow completion.
+        """
+        logger.info("Running Upwork Jobs Automation")
+        self._echo(_MSG_RUNNING)
+
+        try:
+            state = self.graph.invoke(self._initial_state(job_title), self._run_config())
+        finally:
+            if self.verbose:
+                sys.stdout.flush()
         logger.info("Upwork Jobs Automation completed")
         return state
+
+
+# Graph nodes, in workflow order; each maps to an UpworkAutomation method
+_NODE_NAMES = (
+    "scrape_upwork_jobs",
+    "score_scraped_jobs",
+    "check_for_job_matches",
+    "generate_job_application_content",
+    "generate_cover_letter_and_script",
+    "scrape_application_questions",
+    "generate_question_answers",
+    "save_job_application_content",
+)
+
+def _dispatch(method_name):
+    """Build a graph callable that forwards to the UpworkAutomation in the run config"""
+    def call(state, config):
+        automation = config["configurable"]["automation"]
+        return getattr(automation, method_name)(state)
+    call.__name__ = method_name
+    return call
+
+@lru_cache(maxsize=1)
+def _build_compiled_graph(node_names):
+    logger.info("Building graph")
+    graph = StateGraph(GraphState)
+
+    # Create all required nodes
+    for name in node_names:
+        graph.add_node(name, _dispatch(name))
+
+    # Link nodes to complete workflow
+    graph.set_entry_point("scrape_upwork_jobs")
+    graph.add_edge("scrape_upwork_jobs", "score_scraped_jobs")
+    graph.add_edge("score_scraped_jobs", "check_for_job_matches")
+    graph.add_conditional_edges(
+        "check_for_job_matches",
+        _dispatch("need_to_process_matches"),
+        {"Process jobs": "generate_job_application_content", "No matches": END},
+    )
+    # Create sequential flow to avoid concurrent updates
+    graph.add_edge("generate_job_application_content", "generate_cover_letter_and_script")
+    graph.add_edge("generate_cover_letter_and_script", "scrape_application_questions")
+    graph.add_edge("scrape_application_questions", "generate_question_answers")
+    graph.add_edge("generate_question_answers", "save_job_application_content")
+    graph.add_edge("save_job_application_content", "check_for_job_matches")
+    logger.info("Graph built")
+    return graph.compile()
@@ -75,6 +75,9 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
 def start_health_check_server(host='0.0.0.0', port=8000):
     """Start the health check server
     
+    Tries the requested port first and falls back to an ephemeral port if it
+    is already in use.
+    
     Args:
         host (str): Host to bind to (default: '0.0.0.0' for Docker compatibility)
         port (int): Port to listen on (default: 8000)
@@ -82,17 +85,19 @@ def start_health_check_server(host='0.0.0.0', port=8000):
     Returns:
         HTTPServer: The started server instance
     """
-    try:
-        server = HTTPServer((host, port), HealthCheckHandler)
-        thread = threading.Thread(target=server.serve_forever)
-        thread.daemon = True
-        thread.start()
-        logger.info(f"Health check server started on {host}:{port}")
-        return server
-    except Exception as e:
-        logger.error(f"Failed to start health check server: {str(e)}")
-        # Try alternate port if specified port is in use
-        if isinstance(e, OSError) and port != 0:
+    candidates = (port, 0) if port != 0 else (0,)
+    for candidate in candidates:
+        try:
+            server = HTTPServer((host, candidate), HealthCheckHandler)
+            break
+        except OSError as e:
+            logger.error(f"Failed to start health check server on {host}:{candidate}: {str(e)}")
+            if candidate == candidates[-1]:
+                raise
             logger.info("Trying alternate port...")
-            return start_health_check_server(host, 0)
-        raise
+
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    logger.info(f"Health check server started on {host}:{server.server_address[1]}")
+    return server
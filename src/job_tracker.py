@@ -1,17 +1,48 @@
 import os
-import json
+import orjson
 import uuid
 import hashlib
+import time
+from functools import lru_cache
 from datetime import datetime
 from .utils import setup_logger, truncate_content
 
 logger = setup_logger('job_tracker')
 
+# Number of log appends after which a job store is compacted
+COMPACT_EVERY = 500
+
+@lru_cache(maxsize=8192)
+def _fingerprint(description):
+    """Hash a job description, memoized across repeated polls of the same listings"""
+    return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+
+def _description_hash(job_data):
+    """Fingerprint a job description, computing it at most once per job"""
+    if 'description_hash' not in job_data:
+        job_data['description_hash'] = _fingerprint(job_data['description'])
+    return job_data['description_hash']
+
+def _processed_timestamp(record):
+    """Epoch time a job was processed, parsing the ISO string only for legacy records"""
+    timestamp = record.get("processed_at_ts")
+    if timestamp is None:
+        timestamp = datetime.fromisoformat(record["processed_at"]).timestamp()
+    return timestamp
+
 class JobTracker:
     def __init__(self, storage_dir="./files/job_tracking"):
         self.storage_dir = storage_dir
         self.seen_jobs_file = os.path.join(storage_dir, "seen_jobs.json")
         self.processed_jobs_file = os.path.join(storage_dir, "processed_jobs.json")
+        # Parsed file contents keyed by path, valid while the file mtime matches
+        self._cache = {}
+        self._mtime = {}
+        # Log appends since the last compaction, keyed by path
+        self._pending = {}
+        # Description hash -> job id for seen jobs, and the store it was built from
+        self._hash_index = {}
+        self._hash_index_source = None
         self._init_storage()
 
     def _init_storage(self):
@@ -21,26 +52,105 @@ class JobTracker:
         # Initialize files with empty objects
         for filepath in [self.seen_jobs_file, self.processed_jobs_file]:
             if not os.path.exists(filepath):
-                with open(filepath, 'w') as f:
-                    json.dump({}, f)
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps({}))
+
+    def _log_path(self, filepath):
+        """Path of the append-only log that sits next to a job store file"""
+        return filepath + ".log"
+
+    def _stamp(self, filepath):
+        """Modification times of a job store file and its log"""
+        log_path = self._log_path(filepath)
+        log_mtime = os.stat(log_path).st_mtime_ns if os.path.exists(log_path) else None
+        return os.stat(filepath).st_mtime_ns, log_mtime
 
     def _load_json(self, filepath):
-        """Load JSON data from file"""
+        """Load JSON data from file and replay its log, reusing the cached copy if neither changed"""
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            stamp = self._stamp(filepath)
+            if self._mtime.get(filepath) == stamp:
+                return self._cache[filepath]
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+            log_path = self._log_path(filepath)
+            if os.path.exists(log_path):
+                with open(log_path, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            record = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            # A torn final line from an interrupted append
+                            logger.warning(f"Skipping unreadable log record in {log_path}")
+                            continue
+                        data[record["id"]] = record["data"]
+            self._cache[filepath] = data
+            self._mtime[filepath] = stamp
+            return data
         except Exception as e:
             logger.error(f"Error loading {filepath}: {truncate_content(str(e))}")
             return {}
 
     def _save_json(self, filepath, data):
-        """Save data to JSON file"""
+        """Save data to JSON file and clear the log it now contains"""
         try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write a sibling file and rename it over the store so a crash never leaves it half-written
+            tmp_path = filepath + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+            open(self._log_path(filepath), 'wb').close()
+            self._cache[filepath] = data
+            self._mtime[filepath] = self._stamp(filepath)
+            self._pending[filepath] = 0
         except Exception as e:
+            # Callers mutate the cached dict before saving, so drop it on failure
+            self._cache.pop(filepath, None)
+            self._mtime.pop(filepath, None)
             logger.error(f"Error saving to {filepath}: {truncate_content(str(e))}")
 
+    def _append_records(self, filepath, records):
+        """Append job records to the log in one write instead of rewriting the whole file"""
+        if not records:
+            return True
+        data = self._load_json(filepath)
+        payload = b"".join(
+            orjson.dumps({"id": job_id, "data": record}, option=orjson.OPT_APPEND_NEWLINE)
+            for job_id, record in records
+        )
+        try:
+            with open(self._log_path(filepath), 'ab') as f:
+                f.write(payload)
+        except Exception as e:
+            logger.error(f"Error appending to {filepath}: {truncate_content(str(e))}")
+            return False
+        if filepath in self._cache:
+            data.update(records)
+            self._mtime[filepath] = self._stamp(filepath)
+        self._pending[filepath] = self._pending.get(filepath, 0) + len(records)
+        if self._pending[filepath] >= COMPACT_EVERY:
+            self._compact(filepath)
+        return True
+
+    def _compact(self, filepath):
+        """Fold the log back into the JSON file"""
+        self._save_json(filepath, self._load_json(filepath))
+
+    def _description_index(self, seen_jobs):
+        """Map description hashes to job ids, rebuilt only when the seen jobs store is reloaded"""
+        if self._hash_index_source is not seen_jobs:
+            self._hash_index = {}
+            for job in seen_jobs.values():
+                description_hash = job.get('description_hash')
+                if description_hash:
+                    self._hash_index.setdefault(description_hash, job.get('job_id'))
+            self._hash_index_source = seen_jobs
+        return self._hash_index
+
     def is_job_seen(self, job_data):
         """Check if a job has been seen before based on Upwork ID"""
         seen_jobs = self._load_json(self.seen_jobs_file)
@@ -52,66 +162,78 @@ class JobTracker:
             description = job_data.get('description', '')
             if not description:
                 return False
-            description_hash = hashlib.md5(description.encode()).hexdigest()
-            for job in seen_jobs.values():
-                if job.get('description_hash') == description_hash:
-                    return True
-            return False
+            description_hash = _description_hash(job_data)
+            return description_hash in self._description_index(seen_jobs)
             
         # Check if any existing job matches this Upwork ID
         return upwork_id in seen_jobs
 
     def mark_job_seen(self, job_data):
         """Mark a job as seen with timestamp"""
+        return self.mark_jobs_seen([job_data])[0]
+
+    def mark_jobs_seen(self, jobs):
+        """Mark several jobs as seen with a single store write, returning their job IDs"""
         seen_jobs = self._load_json(self.seen_jobs_file)
-        upwork_id = job_data.get('upwork_id')
-        
-        if not upwork_id:
-            logger.warning("No Upwork ID found in job data")
-            # Fall back to description hash if no Upwork ID
-            description = job_data.get('description', '')
-            if not description:
-                job_id = str(uuid.uuid4())
-            else:
-                description_hash = hashlib.md5(description.encode()).hexdigest()
-                # Check if we've seen this description before
-                for existing_job in seen_jobs.values():
-                    if existing_job.get('description_hash') == description_hash:
-                        return existing_job.get('job_id')
-                job_id = str(uuid.uuid4())
-                job_data['description_hash'] = description_hash
-        else:
-            job_id = upwork_id
+        hash_index = self._description_index(seen_jobs)
+        job_ids = []
+        records = []
+        for job_data in jobs:
+            upwork_id = job_data.get('upwork_id')
             
-        job_data['job_id'] = job_id
-        seen_jobs[job_id] = job_data
-        self._save_json(self.seen_jobs_file, seen_jobs)
-        return job_id
+            if not upwork_id:
+                logger.warning("No Upwork ID found in job data")
+                # Fall back to description hash if no Upwork ID
+                description = job_data.get('description', '')
+                if not description:
+                    job_id = str(uuid.uuid4())
+                else:
+                    description_hash = _description_hash(job_data)
+                    # Check if we've seen this description before
+                    if description_hash in hash_index:
+                        job_ids.append(hash_index[description_hash])
+                        continue
+                    job_id = str(uuid.uuid4())
+                    hash_index[description_hash] = job_id
+            else:
+                job_id = upwork_id
+                
+            job_data['job_id'] = job_id
+            job_ids.append(job_id)
+            records.append((job_id, job_data))
+
+        if not self._append_records(self.seen_jobs_file, records):
+            # The index already holds hashes that never reached the store
+            self._hash_index_source = None
+        return job_ids
 
     def mark_job_processed(self, job_id, processing_result):
         """Mark a job as processed with result data"""
-        processed_jobs = self._load_json(self.processed_jobs_file)
-        processed_jobs[job_id] = {
-            "processed_at": datetime.now().isoformat(),
-            "result": processing_result
+        self.mark_jobs_processed({job_id: processing_result})
+
+    def mark_jobs_processed(self, results):
+        """Mark several jobs as processed with a single store write, keyed by job ID"""
+        processed_at = datetime.now()
+        record_base = {
+            "processed_at": processed_at.isoformat(),
+            "processed_at_ts": processed_at.timestamp(),
         }
-        self._save_json(self.processed_jobs_file, processed_jobs)
+        self._append_records(self.processed_jobs_file, [
+            (job_id, {**record_base, "result": result})
+            for job_id, result in results.items()
+        ])
 
     def get_unprocessed_jobs(self):
         """Get list of seen jobs that haven't been processed"""
         seen_jobs = self._load_json(self.seen_jobs_file)
         processed_jobs = self._load_json(self.processed_jobs_file)
         
-        unprocessed = {}
-        for job_id, job_data in seen_jobs.items():
-            if job_id not in processed_jobs:
-                unprocessed[job_id] = job_data
-        
-        return unprocessed
+        unprocessed_ids = seen_jobs.keys() - processed_jobs.keys()
+        return {job_id: seen_jobs[job_id] for job_id in unprocessed_ids}
 
     def cleanup_old_jobs(self, days_to_keep=30):
         """Remove jobs older than specified days"""
-        cutoff = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
+        cutoff = time.time() - (days_to_keep * 24 * 60 * 60)
         
         seen_jobs = self._load_json(self.seen_jobs_file)
         processed_jobs = self._load_json(self.processed_jobs_file)
@@ -119,7 +241,7 @@ class JobTracker:
         # Clean processed jobs
         processed_jobs = {
             k: v for k, v in processed_jobs.items()
-            if datetime.fromisoformat(v["processed_at"]).timestamp() > cutoff
+            if _processed_timestamp(v) > cutoff
         }
         
         # Clean seen jobs that are no longer in processed_jobs
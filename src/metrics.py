@@ -1,7 +1,10 @@
 """Prometheus metrics for monitoring the Upwork job poller"""
 from prometheus_client import Counter, Gauge, Histogram, start_http_server
+import logging
 import time
 
+logger = logging.getLogger('metrics')
+
 # Metrics definitions
 JOBS_SCRAPED = Counter(
     'upwork_jobs_scraped_total',
@@ -53,7 +56,7 @@ def start_metrics_server(port=8001):
         start_http_server(port)
         return True
     except Exception as e:
-        print(f"Failed to start metrics server: {e}")
+        logger.error(f"Failed to start metrics server: {e}")
         return False
 
 class MetricsTimer:
@@ -61,11 +64,13 @@ class MetricsTimer:
     def __init__(self, metric, labels=None):
         self.metric = metric
         self.labels = labels or {}
+        # Resolve the labelled child once rather than on every exit
+        self.child = metric.labels(**self.labels)
         
     def __enter__(self):
-        self.start = time.time()
+        self.start = time.monotonic_ns()
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start
-        self.metric.labels(**self.labels).observe(duration)
+        duration = (time.monotonic_ns() - self.start) / 1e9
+        self.child.observe(duration)
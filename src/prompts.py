@@ -1,3 +1,5 @@
+from string import Formatter
+
 SCRAPER_PROMPT_TEMPLATE = """
 Extract the relevant data from this page content:
 
@@ -42,52 +44,38 @@ Example response for individual job page:
 }}
 """
 
-SCRAPE_QUESTIONS_PROMPT_TEMPLATE = """
-You are an expert at analyzing Upwork job application forms. Your task is to extract any additional questions that appear after the cover letter section.
-
-<content>
-{markdown_content}
-</content>
+SCRAPE_JOBS_BATCH_PROMPT_TEMPLATE = """
+Extract the job details from each of these individual Upwork job pages:
 
-Look for these specific patterns:
-1. Text fields with labels ending in "?"
-2. Required/Optional field indicators
-3. Radio button groups (Yes/No questions)
-4. Checkbox lists (multiple choice)
-5. Textareas for longer answers
-6. Questions about:
-   - Experience with specific technologies
-   - Availability/Timeline
-   - Rate expectations
-   - Portfolio/Similar work examples
-   - Certifications/Qualifications
+{pages}
 
-Return a JSON object with this structure:
-{{
-  "questions": [
-    {{
-      "text": "The exact question text",
-      "type": "text" or "multiple_choice" or "yes_no",
-      "options": ["option1", "option2"] // Only for multiple_choice
-    }}
-  ]
-}}
+**Important Instructions**
+- Each page is wrapped in <page number="N"> tags and describes exactly one job
+- For every page, extract the following fields:
+  * page: The number of the page the job came from (required)
+  * title: The job title (required)
+  * description: The full job description (required)
+  * job_type: Either "Fixed" or "Hourly" (required)
+  * experience_level: The required experience level (required)
+  * duration: The project duration (required)
+  * rate: The payment rate/budget (optional)
+  * client_infomation: Client details like location, history, etc. (optional)
+- Return one object per page in a JSON array under the "jobs" key
+- Never merge details from different pages into one job
 
-Example questions to look for:
-- "What is your experience with [technology]?"
-- "Are you available to start immediately?"
-- "Which of these skills do you have?"
-- "Have you worked on similar projects?"
-- "What is your expected timeline?"
-- "Do you have experience with [specific tool/framework]?"
-
-If no questions are found, return: {{"questions": []}}
-
-Remember:
-- Extract the exact question text
-- Determine the correct question type
-- Include all options for multiple choice questions
-- Look for both required and optional questions
+Example response:
+{{"jobs": [
+  {{
+    "page": 1,
+    "title": "AI Developer Needed",
+    "description": "Full job description here...",
+    "job_type": "Hourly",
+    "experience_level": "Expert",
+    "duration": "3-6 months",
+    "rate": "$50-$70/hr",
+    "client_infomation": "United States | $10k spent | 5 hires"
+  }}
+]}}
 """
 
 ANSWER_QUESTIONS_PROMPT_TEMPLATE = """
@@ -136,26 +124,31 @@ Return a JSON object with this structure:
 {{
   "answers": [
     {{
+      "question_id": "id of the question being answered",
       "answer": "your detailed answer here"
     }}
   ]
 }}
 
-Note: Return ONLY the answer content in the "answer" field. The question text and type will be handled by the system.
+Note: Each question in the input has an "id" field - copy this exact value into "question_id" so every answer is matched to its question. Return ONLY the answer content in the "answer" field. The question text and type will be handled by the system.
 
 Example response:
 {{
   "answers": [
     {{
+      "question_id": "0",
       "answer": "I have 5+ years of experience developing AI solutions, specializing in LLMs and custom AI agents. My background includes..."
     }},
     {{
+      "question_id": "1",
       "answer": "Yes, I can start right away. I currently have availability to fully commit to this project..."
     }},
     {{
+      "question_id": "2",
       "answer": "Beyond VAPI, I am a full-stack developer with 8+ years of experience. I am proficient in both Python and JavaScript/TypeScript, often using Node.js for backend development. Additionally, I have extensive experience in ML development, specifically with LLMs, including GPT models, LangChain, and building custom AI agents."
     }},
     {{
+      "question_id": "3",
       "answer": "I have extensive experience working with N8N, as described in my background. I have built custom nodes, integrated it with numerous APIs, and created full automation platforms using it. Additionally, I've used Make.com and understand the core concepts behind workflow automation, making the transition seamless. Therefore, N8N usage will absolutely not be an issue for me."
     }}
   ]
@@ -199,9 +192,9 @@ Example response for 2 jobs:
 Note: Each job in the input has an "id" field - use this exact value for the job_id in your response.
 """
 
-GENERATE_COVER_LETTER_PROMPT_TEMPLATE = """
-You are an Upwork cover letter specialist, crafting targeted and personalized proposals. 
-Create a persuasive cover letter that aligns with job requirements while highlighting the freelancer's skills and experience.
+GENERATE_APPLICATION_BUNDLE_PROMPT_TEMPLATE = """
+You are an Upwork proposal specialist and freelance interview preparation coach.
+For the job below, write both a persuasive cover letter and a tailored call script for the freelancer.
 
 Freelancer Profile:
 <profile>
@@ -213,28 +206,6 @@ Job Description:
 {job_description}
 </job_description>
 
-Guidelines:
-1. Address the client's needs from the job description; do not over-emphasize the freelancer's profile.
-2. Illustrate how the freelancer can meet these needs based on their past experience.
-3. Show enthusiasm for the job and its concept.
-4. Keep the letter under 150 words, maintaining a friendly and concise tone.
-5. Integrate job-related keywords naturally.
-6. Briefly mention relevant past projects from the freelancer's profile if applicable.
-7. End with "Best, Aymen"
-
-IMPORTANT: Return a JSON object with a single "letter" field containing the cover letter text.
-Example response format:
-{{"letter": "Hey there!\\n\\nI'm excited about...[cover letter content]...\\n\\nBest,\\nAymen"}}
-"""
-
-GENERATE_CALL_SCRIPT_PROMPT_TEMPLATE = """
-You are a freelance interview preparation coach. Create a tailored call script for a freelancer preparing for an interview with a client.
-
-Job Description:
-<job_description>
-{job_description}
-</job_description>
-
 Technical Background:
 <technical_background>
 {technical_background}
@@ -245,14 +216,55 @@ Work Approach:
 {work_approach}
 </work_approach>
 
-The script should include:
+Cover letter guidelines:
+1. Address the client's needs from the job description; do not over-emphasize the freelancer's profile.
+2. Illustrate how the freelancer can meet these needs based on their past experience.
+3. Show enthusiasm for the job and its concept.
+4. Keep the letter under 150 words, maintaining a friendly and concise tone.
+5. Integrate job-related keywords naturally.
+6. Briefly mention relevant past projects from the freelancer's profile if applicable.
+7. End with "Best, Aymen"
+
+The call script should include:
 1. A brief introduction for the freelancer to use
 2. Key points about relevant experience and skills
 3. 10 potential client questions with suggested answers
 4. 10 questions for the freelancer to ask
 5. Maintain a friendly and professional tone
 
-IMPORTANT: Return a JSON object with a single "script" field containing the formatted script.
+IMPORTANT: Return a JSON object with a "letter" field containing the cover letter text and a "script" field containing the formatted script.
 Example response format:
-{{"script": "# Introduction\\n[introduction content]\\n\\n# Key Points\\n[points content]\\n\\n# Client Questions\\n[questions content]\\n\\n# Questions to Ask\\n[questions content]"}}
+{{"letter": "Hey there!\\n\\nI'm excited about...[cover letter content]...\\n\\nBest,\\nAymen", "script": "# Introduction\\n[introduction content]\\n\\n# Key Points\\n[points content]\\n\\n# Client Questions\\n[questions content]\\n\\n# Questions to Ask\\n[questions content]"}}
 """
+
+
+def _compile_template(template, *field_names):
+    """
+    Parse a prompt template once and return a renderer equivalent to template.format.
+    Values are inserted verbatim, so braces in scraped content are safe.
+    """
+    parts = tuple(Formatter().parse(template))
+    placeholders = {field for _, field, _, _ in parts if field is not None}
+    if placeholders != set(field_names):
+        raise ValueError(f"Template placeholders {sorted(placeholders)} do not match {sorted(field_names)}")
+
+    def render(**fields):
+        chunks = []
+        for literal, field, _, _ in parts:
+            chunks.append(literal)
+            if field is not None:
+                chunks.append(str(fields[field]))
+        return "".join(chunks)
+
+    return render
+
+
+render_scraper_prompt = _compile_template(SCRAPER_PROMPT_TEMPLATE, "markdown_content")
+render_scrape_jobs_batch_prompt = _compile_template(SCRAPE_JOBS_BATCH_PROMPT_TEMPLATE, "pages")
+render_answer_questions_prompt = _compile_template(
+    ANSWER_QUESTIONS_PROMPT_TEMPLATE, "job_description", "technical_background", "work_approach", "questions"
+)
+render_score_jobs_prompt = _compile_template(SCORE_JOBS_PROMPT_TEMPLATE, "profile", "jobs")
+render_application_bundle_prompt = _compile_template(
+    GENERATE_APPLICATION_BUNDLE_PROMPT_TEMPLATE, "profile", "job_description", "technical_background", "work_approach"
+)
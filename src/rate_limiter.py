@@ -0,0 +1,58 @@
+"""Token bucket rate limiter for pacing calls to external APIs"""
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class RateLimiter:
+    """Shared request and token budget, refilled continuously per minute"""
+    def __init__(self, requests_per_minute: int = 10, tokens_per_minute: int = 4_000_000):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self.request_allowance = float(requests_per_minute)
+        self.token_allowance = float(tokens_per_minute)
+        self.blocked_until = 0.0
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Top up both buckets for the time elapsed since the last refill"""
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        self.request_allowance = min(
+            self.requests_per_minute,
+            self.request_allowance + elapsed * self.requests_per_minute / 60
+        )
+        self.token_allowance = min(
+            self.tokens_per_minute,
+            self.token_allowance + elapsed * self.tokens_per_minute / 60
+        )
+
+    def acquire(self, estimated_tokens: int = 0):
+        """Block until a request of the estimated size fits within both limits"""
+        estimated_tokens = min(estimated_tokens, self.tokens_per_minute)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.request_allowance >= 1 and self.token_allowance >= estimated_tokens:
+                        self.request_allowance -= 1
+                        self.token_allowance -= estimated_tokens
+                        return
+                    wait = max(
+                        (1 - self.request_allowance) * 60 / self.requests_per_minute,
+                        (estimated_tokens - self.token_allowance) * 60 / self.tokens_per_minute
+                    )
+            logger.debug(f"Rate limit reached, waiting {wait:.1f}s")
+            time.sleep(wait)
+
+    def penalize(self, delay: float):
+        """Hold every caller for delay seconds after the API reported a rate limit"""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+            self.request_allowance = 0.0
+        logger.warning(f"Rate limit reported by API, pausing requests for {delay:.1f}s")
@@ -32,6 +32,12 @@ class JobInformation(BaseModel):
     client_infomation: Optional[str] = Field(
         description="The description of the client including location, number of hires, total spent, etc."
     )
+
+class PageJobInformation(JobInformation):
+    page: int = Field(description="The number of the page the job was extracted from")
+
+class JobInformationBatch(BaseModel):
+    jobs: List[PageJobInformation] = Field(description="The jobs extracted from each page")
     
 class JobScore(BaseModel):
     job_id: str = Field(description="The id of the job")
@@ -40,26 +46,12 @@ class JobScore(BaseModel):
 class JobScores(BaseModel):
     matches: List[JobScore] = Field(description="The list of job scores")
     
-class CoverLetter(BaseModel):
+class ApplicationBundle(BaseModel):
     letter: str = Field(description="The generated cover letter")
-    
-class CallScript(BaseModel):
     script: str = Field(description="The generated call script")
 
-class QuestionType(str, Enum):
-    TEXT = "text"
-    MULTIPLE_CHOICE = "multiple_choice"
-    YES_NO = "yes_no"
-
-class Question(BaseModel):
-    text: str = Field(description="The question text")
-    type: QuestionType = Field(description="The type of question")
-    options: Optional[List[str]] = Field(description="Options for multiple choice questions")
-
-class Questions(BaseModel):
-    questions: List[dict] = Field(description="List of questions from the job application", default_factory=list)
-
 class Answer(BaseModel):
+    question_id: str = Field(description="The id of the question being answered")
     answer: str = Field(description="The answer to the question")
 
 class Answers(BaseModel):
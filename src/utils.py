@@ -1,13 +1,16 @@
-import os, re, time, json, hashlib
-import html2text
+import os, re, time, hashlib, random, copy, atexit
+import orjson
 import pandas as pd
 from datetime import datetime
 from tqdm import tqdm
-from playwright.sync_api import sync_playwright
-import google.generativeai as genai
 import logging
+import threading
 from typing import List, Optional
 from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 
 @dataclass
 class TurnstileResult:
@@ -35,6 +38,11 @@ class TurnstileSolver:
       </body>
     </html>
     """
+    # Resolves to the token once the widget has filled in its response field
+    TOKEN_READY_JS = """() => {
+        const el = document.querySelector('[name=cf-turnstile-response]');
+        return el && el.value ? el.value : null;
+    }"""
 
     def __init__(self, debug: bool = False):
         self.debug = debug
@@ -66,48 +74,40 @@ class TurnstileSolver:
         
         if self.debug:
             self.log.debug("Getting window dimensions.")
-        page.window_width = page.evaluate("window.innerWidth")
-        page.window_height = page.evaluate("window.innerHeight")
+        page.window_width, page.window_height = page.evaluate("() => [window.innerWidth, window.innerHeight]")
         
         return page
 
     def _get_turnstile_response(self, page, max_attempts: int = 10) -> Optional[str]:
         """Attempt to retrieve Turnstile response."""
-        attempts = 0
-        
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
         if self.debug:
             self.log.debug("Starting Turnstile response retrieval loop.")
         
-        while attempts < max_attempts:
-            turnstile_check = page.eval_on_selector(
-                "[name=cf-turnstile-response]", 
-                "el => el.value"
-            )
+        # Calculate click position based on window dimensions
+        x = page.window_width // 2
+        y = page.window_height // 2
 
-            if turnstile_check == "":
+        for attempt in range(max_attempts):
+            page.evaluate("document.querySelector('.cf-turnstile').style.width = '70px'")
+            page.mouse.click(x, y)
+            try:
+                # Returns as soon as the token appears instead of sleeping a fixed interval
+                handle = page.wait_for_function(self.TOKEN_READY_JS, timeout=500)
+            except PlaywrightTimeoutError:
                 if self.debug:
-                    self.log.debug(f"Attempt {attempts + 1}: No Turnstile response yet.")
-                
-                # Calculate click position based on window dimensions
-                x = page.window_width // 2
-                y = page.window_height // 2
-                
-                page.evaluate("document.querySelector('.cf-turnstile').style.width = '70px'")
-                page.mouse.click(x, y)
-                time.sleep(0.5)
-                attempts += 1
-            else:
-                turnstile_element = page.query_selector("[name=cf-turnstile-response]")
-                if turnstile_element:
-                    value = turnstile_element.get_attribute("value")
-                    if self.debug:
-                        self.log.debug(f"Turnstile response received: {value}")
-                    return value
-                break
+                    self.log.debug(f"Attempt {attempt + 1}: No Turnstile response yet.")
+                continue
+
+            value = handle.json_value()
+            if self.debug:
+                self.log.debug(f"Turnstile response received: {value}")
+            return value
         
         return None
 
-    def solve(self, url: str, sitekey: str, headless: bool = False) -> TurnstileResult:
+    def solve(self, url: str, sitekey: str, headless: bool = False, context=None) -> TurnstileResult:
         """
         Solve the Turnstile challenge and return the result.
         
@@ -115,77 +115,94 @@ class TurnstileSolver:
             url: The URL where the Turnstile challenge is hosted
             sitekey: The Turnstile sitekey
             headless: Whether to run the browser in headless mode
+            context: Open browser context to solve in; a new browser is launched when omitted
             
         Returns:
             TurnstileResult object containing the solution details
         """
+        if context is not None:
+            return self._solve_in_context(context, url, sitekey)
+
+        browser = _thread_playwright().chromium.launch(headless=headless, args=self.browser_args)
+        context = browser.new_context()
+
+        try:
+            return self._solve_in_context(context, url, sitekey)
+        finally:
+            context.close()
+            browser.close()
+
+            if self.debug:
+                self.log.debug("Browser closed. Returning result.")
+
+    def _solve_in_context(self, context, url: str, sitekey: str) -> TurnstileResult:
+        """Solve the challenge on a new page of the given context, closing only that page."""
         start_time = time.time()
+        page = self._setup_page(context, url, sitekey)
+        try:
+            turnstile_value = self._get_turnstile_response(page)
+        finally:
+            page.close()
 
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(headless=headless, args=self.browser_args)
-            context = browser.new_context()
+        elapsed_time = round(time.time() - start_time, 3)
 
-            try:
-                page = self._setup_page(context, url, sitekey)
-                turnstile_value = self._get_turnstile_response(page)
-                
-                elapsed_time = round(time.time() - start_time, 3)
-                
-                if not turnstile_value:
-                    result = TurnstileResult(
-                        turnstile_value=None,
-                        elapsed_time_seconds=elapsed_time,
-                        status="failure",
-                        reason="Max attempts reached without token retrieval"
-                    )
-                    self.log.error("Failed to retrieve Turnstile value.")
-                else:
-                    result = TurnstileResult(
-                        turnstile_value=turnstile_value,
-                        elapsed_time_seconds=elapsed_time,
-                        status="success"
-                    )
-                    self.log.info(
-                        f"Successfully solved captcha: {turnstile_value[:45]}..."
-                    )
-
-            finally:
-                context.close()
-                browser.close()
+        if not turnstile_value:
+            result = TurnstileResult(
+                turnstile_value=None,
+                elapsed_time_seconds=elapsed_time,
+                status="failure",
+                reason="Max attempts reached without token retrieval"
+            )
+            self.log.error("Failed to retrieve Turnstile value.")
+        else:
+            result = TurnstileResult(
+                turnstile_value=turnstile_value,
+                elapsed_time_seconds=elapsed_time,
+                status="success"
+            )
+            self.log.info(
+                f"Successfully solved captcha: {turnstile_value[:45]}..."
+            )
 
-                if self.debug:
-                    self.log.debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
-                    self.log.debug("Browser closed. Returning result.")
+        if self.debug:
+            self.log.debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
 
         return result
 
 from .structured_outputs import (
     UpworkJobs,
     JobInformation,
+    JobInformationBatch,
     JobScores,
-    CoverLetter,
-    CallScript,
-    Questions,
+    ApplicationBundle,
     Answers,
 )
 from .prompts import *
-
-# Initialize Gemini API
-api_key = os.getenv('GOOGLE_API_KEY')
-if not api_key:
-    raise ValueError("GOOGLE_API_KEY environment variable is required")
-genai.configure(api_key=api_key)
+from .rate_limiter import RateLimiter
 
 def truncate_content(content, max_length=200):
     """Truncate content for logging purposes"""
     if isinstance(content, str) and len(content) > max_length:
         return content[:max_length] + "..."
+    elif not _needs_truncation(content, max_length):
+        # Small payloads are logged as-is rather than rebuilt
+        return content
     elif isinstance(content, dict):
-        return {k: truncate_content(v) for k, v in content.items()}
+        return {k: truncate_content(v, max_length) for k, v in content.items()}
     elif isinstance(content, list):
-        return [truncate_content(item) for item in content]
+        return [truncate_content(item, max_length) for item in content]
     return content
 
+def _needs_truncation(content, max_length=200):
+    """Whether truncate_content would change anything inside content"""
+    if isinstance(content, str):
+        return len(content) > max_length
+    if isinstance(content, dict):
+        return any(_needs_truncation(v, max_length) for v in content.values())
+    if isinstance(content, list):
+        return any(_needs_truncation(item, max_length) for item in content)
+    return False
+
 def setup_logger(name, level=logging.INFO):
     """Centralized logger setup with concise formatting"""
     # Prevent duplicate handlers
@@ -211,14 +228,95 @@ def setup_logger(name, level=logging.INFO):
 logger = setup_logger('utils')
 
 SCRAPED_JOBS_FOLDER = "./files/upwork_job_listings/"
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"
+# Maximum number of Gemini requests in flight at once
+GEMINI_CONCURRENCY = 5
+# Upper bound in seconds for a single Gemini retry backoff
+MAX_RETRY_DELAY = 30
+# Shared Gemini quota, so concurrent callers pace themselves instead of sleeping blindly
+gemini_rate_limiter = RateLimiter(
+    requests_per_minute=int(os.getenv("GEMINI_RPM", "10")),
+    tokens_per_minute=int(os.getenv("GEMINI_TPM", "4000000")),
+)
+
+# Columns the Gemini job extraction may omit, filled with empty strings
+OPTIONAL_JOB_COLUMNS = ["rate", "client_infomation", "experience_level", "duration"]
+# Exact-match Gemini response cache, on disk and for recent keys in memory
+LLM_CACHE_DIR = "./files/cache/llm"
+LLM_MEMORY_CACHE_SIZE = 512
+# Seconds a cached Gemini response stays valid
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+_llm_memory_cache = {}
+_llm_cache_lock = threading.Lock()
+# Page resources skipped while scraping
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+# Anti-detection flags for the visible Chromium used on apply pages
+APPLY_BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--window-position=2000,2000",
+]
+# Questions scraped per apply URL
+QUESTIONS_CACHE_DIR = "./files/cache/apply_questions"
+# Cookies an apply page needs to load as the logged-in freelancer
+REQUIRED_COOKIES = frozenset({
+    'master_access_token',
+    'oauth2_global_js_token',
+    'XSRF-TOKEN',
+    'console_user',
+    'user_uid',
+    'recognized',
+})
+# Per-thread Playwright driver and apply page browser, reused across calls
+_playwright_local = threading.local()
+# Elements that mark a search or job page as rendered
+PAGE_CONTENT_SELECTOR = "article[data-test='JobTile'], section[data-test='JobDescription']"
+# Job pages extracted per Gemini call
+EXTRACTION_BATCH_SIZE = 5
+# Jobs scored per Gemini call; larger batches amortize the prompt preamble
+SCORE_BATCH_SIZE = 20
+# Job fields sent to Gemini for scoring
+SCORED_JOB_FIELDS = ["title", "experience_level", "job_type", "duration", "rate", "description", "client_infomation"]
+
+# Patterns used on every scraped page and job row, compiled once
+EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+NON_VISIBLE_TAGS_RE = re.compile(r"<(script|style|svg|noscript)\b[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
+UPWORK_ID_RE = re.compile(r'_~([^/]+)/')
+# Job links in html2text output of a search page, e.g. [Title](/jobs/Title_~0123/?referrer=...)
+JOB_LINK_RE = re.compile(r"\]\((?:https://www\.upwork\.com)?(/jobs/[^)\s?#]*_~[^)\s/?#]+)")
+# JSON body of a markdown code fence, with or without the json language tag
+JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+RATE_RANGE_RE = re.compile(r"\$?(\d+\.?\d*)\s*\n*-\n*\$?(\d+\.?\d*)")
+MARKDOWN_STARS_RE = re.compile(r"\*+")
+CLIENT_INFO_PATTERNS = (
+    (re.compile(r"\s+"), " "),  # Remove multiple spaces
+    (re.compile(r"\|\s*\|"), "|"),  # Remove multiple separators
+    (re.compile(r"\s*\|\s*"), " | "),  # Clean up spaces around separators
+)
+
+def url_cache_key(url):
+    """File name stem for a cached page, derived from its URL"""
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+def write_cache_file(filename, content):
+    """Write a file via a temp file and rename, so readers never see a partial file"""
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp_filename, "wb") as file:
+        file.write(content.encode("utf-8"))
+    os.replace(tmp_filename, filename)
 
 def load_cookies():
     """Load authentication cookies from file"""
     cookie_file = "./files/auth/cookies.json"
     try:
         if os.path.exists(cookie_file):
-            with open(cookie_file, 'r') as f:
-                return json.load(f)
+            with open(cookie_file, 'rb') as f:
+                return orjson.loads(f.read())
         else:
             logger.warning(f"Cookie file not found at {cookie_file}")
             return []
@@ -231,115 +329,241 @@ def save_cookies(cookies):
     cookie_file = "./files/auth/cookies.json"
     os.makedirs(os.path.dirname(cookie_file), exist_ok=True)
     try:
-        with open(cookie_file, 'w') as f:
-            json.dump(cookies, f, indent=2)
+        write_cache_file(cookie_file, orjson.dumps(cookies, option=orjson.OPT_INDENT_2).decode())
         logger.info(f"Cookies saved to {cookie_file}")
     except Exception as e:
         logger.error(f"Error saving cookies: {e}")
 
+# Hand-written Gemini response schemas for the structured outputs used on the hot path
+SCHEMA_DICTS = {
+    UpworkJobs: {
+        "type": "object",
+        "properties": {
+            "jobs": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "link": {"type": "string"}
+                    },
+                    "required": ["link"]
+                }
+            }
+        },
+        "required": ["jobs"]
+    },
+    JobInformation: {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string"},
+            "description": {"type": "string"},
+            "job_type": {"type": "string", "enum": ["Fixed", "Hourly"]},
+            "experience_level": {"type": "string"},
+            "duration": {"type": "string"},
+            "rate": {"type": "string"},
+            "client_infomation": {"type": "string"}
+        },
+        "required": ["title", "description", "job_type", "experience_level", "duration"]
+    },
+    JobInformationBatch: {
+        "type": "object",
+        "properties": {
+            "jobs": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "page": {"type": "integer"},
+                        "title": {"type": "string"},
+                        "description": {"type": "string"},
+                        "job_type": {"type": "string", "enum": ["Fixed", "Hourly"]},
+                        "experience_level": {"type": "string"},
+                        "duration": {"type": "string"},
+                        "rate": {"type": "string"},
+                        "client_infomation": {"type": "string"}
+                    },
+                    "required": ["page", "title", "description", "job_type", "experience_level", "duration"]
+                }
+            }
+        },
+        "required": ["jobs"]
+    },
+    JobScores: {
+        "type": "object",
+        "properties": {
+            "matches": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "job_id": {"type": "string"},
+                        "score": {"type": "integer"}
+                    },
+                    "required": ["job_id", "score"]
+                }
+            }
+        },
+        "required": ["matches"]
+    },
+    ApplicationBundle: {
+        "type": "object",
+        "properties": {
+            "letter": {"type": "string"},
+            "script": {"type": "string"}
+        },
+        "required": ["letter", "script"]
+    },
+}
+
+def _strip_defs(schema):
+    """Remove every $defs entry from a JSON schema in place, without recursion"""
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            node.pop("$defs", None)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+@lru_cache(maxsize=None)
+def _compile_schema(response_schema):
+    """Build a Gemini-compatible schema from a pydantic model, once per model class"""
+    schema_dict = response_schema.model_json_schema()
+    _strip_defs(schema_dict)
+    return schema_dict
+
+@lru_cache(maxsize=None)
+def _configure_gemini():
+    """Import and configure the Gemini SDK on first use, keeping it off the import path"""
+    import google.generativeai as genai
+
+    api_key = os.getenv('GOOGLE_API_KEY')
+    if not api_key:
+        raise ValueError("GOOGLE_API_KEY environment variable is required")
+    genai.configure(api_key=api_key)
+    return genai
+
+@lru_cache(maxsize=32)
+def _get_model(model, response_schema=None):
+    """Return a GenerativeModel for the model name and response schema, reused across calls"""
+    genai = _configure_gemini()
+    if response_schema is None:
+        return genai.GenerativeModel(model)
+    schema_dict = SCHEMA_DICTS.get(response_schema) or _compile_schema(response_schema)
+    return genai.GenerativeModel(
+        model,
+        generation_config={
+            "response_mime_type": "application/json",
+            # The SDK may rewrite the schema it is given; keep the shared one pristine
+            "response_schema": copy.deepcopy(schema_dict),
+        },
+    )
+
+def _retry_delay(attempt, base_delay, error):
+    """Jittered exponential backoff, deferring to a Retry-After header when the error carries one; both capped"""
+    response = getattr(error, "response", None)
+    retry_after = (getattr(response, "headers", None) or {}).get("Retry-After")
+    if retry_after:
+        try:
+            # A large server hint must not stall the worker beyond the backoff cap
+            return max(0.0, min(float(retry_after), MAX_RETRY_DELAY))
+        except ValueError:
+            pass
+    # Jitter keeps concurrent callers from retrying in lockstep
+    delay = base_delay * (2 ** (attempt - 1)) * (1 + random.random() * 0.5)
+    return min(delay, MAX_RETRY_DELAY)
+
+def _llm_cache_key(prompt, response_schema, model):
+    """SHA-256 of the inputs that determine a Gemini response"""
+    schema_name = response_schema.__name__ if response_schema is not None else None
+    payload = orjson.dumps(
+        {"model": model, "prompt": prompt, "schema": schema_name}, option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+def _load_cached_response(key):
+    """Return a previously stored Gemini output for the key, or None"""
+    with _llm_cache_lock:
+        stored_at, payload = _llm_memory_cache.get(key, (None, None))
+    if payload is None:
+        filename = os.path.join(LLM_CACHE_DIR, f"{key}.json")
+        try:
+            with open(filename, "rb") as file:
+                stored_at = os.fstat(file.fileno()).st_mtime
+                payload = file.read()
+        except FileNotFoundError:
+            return None
+        if time.time() - stored_at >= LLM_CACHE_TTL:
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+            return None
+        _remember_response(key, payload, stored_at)
+    elif time.time() - stored_at >= LLM_CACHE_TTL:
+        with _llm_cache_lock:
+            _llm_memory_cache.pop(key, None)
+        return None
+    # Decode on every hit so callers can mutate their copy
+    return orjson.loads(payload)
+
+def _store_cached_response(key, output):
+    """Persist a Gemini output to the memory and disk caches"""
+    payload = orjson.dumps(output)
+    _remember_response(key, payload)
+    try:
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        write_cache_file(os.path.join(LLM_CACHE_DIR, f"{key}.json"), payload.decode())
+    except OSError as e:
+        logger.warning(f"Could not write Gemini response cache: {e}")
+
+def _remember_response(key, payload, stored_at=None):
+    """Keep a serialized output in the bounded in-memory cache"""
+    with _llm_cache_lock:
+        if len(_llm_memory_cache) >= LLM_MEMORY_CACHE_SIZE:
+            _llm_memory_cache.pop(next(iter(_llm_memory_cache)))
+        _llm_memory_cache[key] = (stored_at or time.time(), payload)
+
+def _is_cacheable_response(output, response_schema):
+    """Whether a Gemini output parsed as JSON and, when a schema was requested, validates against it"""
+    if not isinstance(output, (dict, list)):
+        return False
+    if response_schema is None:
+        return True
+    try:
+        response_schema.model_validate(output)
+    except Exception:
+        return False
+    return True
+
 def call_gemini_api(
-    prompt: str, response_schema=None, model="gemini-2.0-flash-exp", max_retries=5, base_delay=10
+    prompt: str, response_schema=None, model="gemini-2.0-flash-exp", max_retries=5, base_delay=10, use_cache=True
 ) -> tuple:
     logger.info(f"Calling Gemini API with model: {model}")
     
+    if use_cache:
+        cache_key = _llm_cache_key(prompt, response_schema, model)
+        output = _load_cached_response(cache_key)
+        if output is not None:
+            logger.info("Gemini API response served from cache.")
+            return output, {"input_tokens": 0, "output_tokens": 0, "cached": True}
+    
+    last_error = None
     for attempt in range(max_retries):
         try:
-            # Add base delay between API calls to avoid rate limits
             if attempt > 0:
-                delay = base_delay * (2 ** (attempt - 1))  # Exponential backoff
-                logger.warning(f"API quota exhausted, retrying in {delay} seconds (attempt {attempt + 1}/{max_retries})...")
-                time.sleep(delay)
-            
-            llm = genai.GenerativeModel(model)
-            if response_schema is not None:
-                if response_schema == UpworkJobs:
-                    schema_dict = {
-                        "type": "object",
-                        "properties": {
-                            "jobs": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "link": {"type": "string"}
-                                    },
-                                    "required": ["link"]
-                                }
-                            }
-                        },
-                        "required": ["jobs"]
-                    }
-                elif response_schema == JobInformation:
-                    schema_dict = {
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string"},
-                            "description": {"type": "string"},
-                            "job_type": {"type": "string", "enum": ["Fixed", "Hourly"]},
-                            "experience_level": {"type": "string"},
-                            "duration": {"type": "string"},
-                            "rate": {"type": "string"},
-                            "client_infomation": {"type": "string"}
-                        },
-                        "required": ["title", "description", "job_type", "experience_level", "duration"]
-                    }
-                elif response_schema == JobScores:
-                    schema_dict = {
-                        "type": "object",
-                        "properties": {
-                            "matches": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "job_id": {"type": "string"},
-                                        "score": {"type": "integer"}
-                                    },
-                                    "required": ["job_id", "score"]
-                                }
-                            }
-                        },
-                        "required": ["matches"]
-                    }
-                elif response_schema == CoverLetter:
-                    schema_dict = {
-                        "type": "object",
-                        "properties": {
-                            "letter": {"type": "string"}
-                        },
-                        "required": ["letter"]
-                    }
-                elif response_schema == CallScript:
-                    schema_dict = {
-                        "type": "object",
-                        "properties": {
-                            "script": {"type": "string"}
-                        },
-                        "required": ["script"]
-                    }
+                delay = _retry_delay(attempt, base_delay, last_error)
+                logger.warning(f"Retryable API error, retrying in {delay:.1f} seconds (attempt {attempt + 1}/{max_retries})...")
+                if "Resource has been exhausted" in str(last_error):
+                    # Quota errors pause every caller, not just this one
+                    gemini_rate_limiter.penalize(delay)
                 else:
-                    schema_dict = response_schema.model_json_schema()
-                    
-                    def remove_defs(d):
-                        if isinstance(d, dict):
-                            if "$defs" in d:
-                                del d["$defs"]
-                            for k, v in d.items():
-                                remove_defs(v)
-                        elif isinstance(d, list):
-                            for item in d:
-                                remove_defs(item)
-                    
-                    remove_defs(schema_dict)
-                
-                llm = genai.GenerativeModel(
-                    model,
-                    generation_config={
-                        "response_mime_type": "application/json",
-                        "response_schema": schema_dict,
-                    },
-                )
-
+                    time.sleep(delay)
+            
+            # Roughly four characters per token
+            gemini_rate_limiter.acquire(estimated_tokens=len(prompt) // 4)
+            llm = _get_model(model, response_schema)
             completion = llm.generate_content(prompt)
             usage_metadata = completion.usage_metadata
             token_counts = {
@@ -348,25 +572,26 @@ def call_gemini_api(
             }
             
             try:
-                output = json.loads(completion.text)
+                output = orjson.loads(completion.text)
                 # Handle array responses by taking first item
                 if isinstance(output, list) and len(output) > 0:
                     output = output[0]
-                logger.debug(f"API response: {truncate_content(output)}")
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 output = completion.text
-                logger.debug(f"API response: {truncate_content(output)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API response: %s", truncate_content(output))
                 
+            # Only keep well-formed responses; a bad completion must not be replayed on every retry
+            if use_cache and _is_cacheable_response(output, response_schema):
+                _store_cached_response(cache_key, output)
             logger.info("Gemini API call completed.")
             return output, token_counts
             
         except Exception as e:
             if attempt < max_retries - 1:
-                if "Resource has been exhausted" in str(e):
+                if "Resource has been exhausted" in str(e) or "500 An internal error has occurred" in str(e):
                     # Delay is handled at the start of the next iteration
-                    continue
-                elif "500 An internal error has occurred" in str(e):
-                    logger.warning("Internal server error, retrying...")
+                    last_error = e
                     continue
                 else:
                     logger.error(f"Unexpected error: {e}")
@@ -377,17 +602,139 @@ def call_gemini_api(
 
 
 def read_text_file(filename):
+    """Read a text file without blank lines, reusing the result until the file changes"""
+    return _read_text_file_cached(filename, os.stat(filename).st_mtime_ns)
+
+@lru_cache(maxsize=32)
+def _read_text_file_cached(filename, mtime_ns):
     logger.info(f"Reading text file: {filename}")
     with open(filename, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-        lines = [line.strip() for line in lines if line.strip()]
-        logger.info(f"Text file read: {filename}")
-        return "".join(lines)
+        content = file.read()
+    logger.info(f"Text file read: {filename}")
+    return "\n".join(line for line in content.splitlines() if line.strip())
 
 
-def scrape_website_to_markdown(url: str) -> str:
+@contextmanager
+def upwork_browser_context():
+    """Launch one browser with the Upwork cookies, shared by every page scraped inside the block"""
+    browser = _thread_playwright().firefox.launch(headless=True)
+    try:
+        # Set up context with authentication cookies for Upwork
+        context = browser.new_context(user_agent=USER_AGENT)
+        
+        # Load and add authentication cookies
+        cookies = load_cookies()
+        if cookies:
+            context.add_cookies(cookies)
+        else:
+            logger.warning("No authentication cookies found")
+
+        # Images, fonts and media are dropped from the markdown anyway, so don't download them
+        context.route("**/*", _block_heavy_resources)
+
+        yield context
+
+        # If this session started without cookies, save them for future use
+        if not cookies:
+            save_cookies(context.cookies())
+    finally:
+        browser.close()
+
+def _thread_playwright():
+    """Playwright driver for the calling thread, started on first use; the sync API allows one per thread"""
+    playwright = getattr(_playwright_local, "playwright", None)
+    if playwright is None:
+        from playwright.sync_api import sync_playwright
+
+        playwright = sync_playwright().start()
+        _playwright_local.playwright = playwright
+        if threading.current_thread() is threading.main_thread():
+            atexit.register(_stop_thread_playwright)
+    return playwright
+
+def _stop_thread_playwright():
+    """Close the calling thread's apply page browser and Playwright driver"""
+    browser = getattr(_playwright_local, "apply_browser", None)
+    playwright = getattr(_playwright_local, "playwright", None)
+    _playwright_local.__dict__.clear()
+    try:
+        if browser is not None and browser.is_connected():
+            browser.close()
+        if playwright is not None:
+            playwright.stop()
+    except Exception as e:
+        logger.debug(f"Error shutting down Playwright: {e}")
+
+@contextmanager
+def _apply_page(cookies):
+    """Open a page for an apply URL in this thread's long-lived Chromium, closing only the page"""
+    browser = getattr(_playwright_local, "apply_browser", None)
+    if browser is None or not browser.is_connected():
+        # Show browser for better challenge handling
+        browser = _thread_playwright().chromium.launch(headless=False, args=APPLY_BROWSER_ARGS)
+        _playwright_local.apply_browser = browser
+        _playwright_local.apply_context = browser.new_context(user_agent=USER_AGENT)
+    context = _playwright_local.apply_context
+    # Cookies may have been refreshed on disk since the browser started
+    context.add_cookies(cookies)
+    page = context.new_page()
+    try:
+        yield page
+    finally:
+        page.close()
+
+
+def _block_heavy_resources(route):
+    """Abort requests for resources the markdown conversion never uses"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _fetch_page_html(context, url, text_only=False):
+    """Load a page in an open browser context and return its HTML (or visible text), or None on failure"""
+    page = context.new_page()
+    try:
+        # Navigate to the URL; the dynamic content wait below covers the rest of the load
+        response = page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        if response.status == 401 or response.status == 403:
+            logger.error(f"Authentication failed for URL: {url}")
+            return None
+            
+        # Wait for the job content itself rather than for analytics traffic to go quiet
+        try:
+            page.wait_for_selector(PAGE_CONTENT_SELECTOR, timeout=10000)
+        except Exception as e:
+            logger.debug(f"Content selector not found on {url}, waiting for network idle: {e}")
+            page.wait_for_load_state("networkidle")
+        
+        # Get the page content; visible text skips serializing scripts and styles
+        if text_only:
+            html_content = page.inner_text("body", timeout=5000)
+        else:
+            html_content = page.content()
+        logger.debug(f"Retrieved content from {url}")
+        return html_content
+        
+    except Exception as e:
+        logger.error(f"Error scraping URL {url}: {str(e)}")
+        return None
+    finally:
+        page.close()
+
+
+def scrape_website_to_markdown(url: str, context=None) -> str:
+    """
+    Scrape a page to markdown, using a 1 minute file cache. Pass an open
+    upwork_browser_context to reuse its browser instead of launching one.
+    """
+    return _scrape_page(url, context)[0]
+
+
+def _scrape_page(url, context=None, text_only=False):
+    """Scrape a page to markdown, or plain visible text if text_only, returning (content, served_from_cache)"""
     logger.info(f"Scraping website: {url}")
-    USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"
 
     # Determine cache directory based on URL type
     if "/apply/" in url:
@@ -397,8 +744,8 @@ def scrape_website_to_markdown(url: str) -> str:
     os.makedirs(cache_dir, exist_ok=True)
     
     # Create a filename based on a hash of the URL
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    filename = os.path.join(cache_dir, f"{url_hash}.md")
+    url_hash = url_cache_key(url)
+    filename = os.path.join(cache_dir, f"{url_hash}.txt" if text_only else f"{url_hash}.md")
     
     # Check if the file exists and is less than 1 minute old
     if os.path.exists(filename):
@@ -406,72 +753,48 @@ def scrape_website_to_markdown(url: str) -> str:
         if file_age < 60:  # 60 seconds = 1 minute
             with open(filename, "r", encoding="utf-8") as file:
                 logger.debug(f"Using cached content ({int(file_age)}s old): {filename}")
-                return file.read()
+                return file.read(), True
         else:
             logger.debug(f"Cache expired ({int(file_age)}s old): {filename}")
     
     # If not, scrape the page
-    with sync_playwright() as playwright:
-        browser = playwright.firefox.launch(headless=True)
-        
-        # Set up context with authentication cookies for Upwork
-        context = browser.new_context(user_agent=USER_AGENT)
-        
-        # Load and add authentication cookies
-        cookies = load_cookies()
-        if cookies:
-            context.add_cookies(cookies)
-        else:
-            logger.warning("No authentication cookies found")
+    if context is None:
+        with upwork_browser_context() as context:
+            html_content = _fetch_page_html(context, url, text_only)
+    else:
+        html_content = _fetch_page_html(context, url, text_only)
+    if html_content is None:
+        return "", False
 
-        page = context.new_page()
-        
-        try:
-            # Navigate to the URL and wait for the page to load
-            response = page.goto(url, wait_until="networkidle")
-            if response.status == 401 or response.status == 403:
-                logger.error(f"Authentication failed for URL: {url}")
-                return ""
-                
-            # Wait for any dynamic content to load
-            page.wait_for_load_state("networkidle")
-            
-            # Get the page content
-            html_content = page.content()
-            logger.debug(f"Retrieved content from {url}")
-            
-            # If this is the first successful request, save the cookies for future use
-            if not cookies:
-                new_cookies = context.cookies()
-                save_cookies(new_cookies)
-            
-        except Exception as e:
-            logger.error(f"Error scraping URL {url}: {str(e)}")
-            return ""
-        finally:
-            browser.close()
+    if text_only:
+        markdown_content = html_content
+    else:
+        # Drop non-visible markup in C before the pure-Python html2text parser sees it
+        html_content = NON_VISIBLE_TAGS_RE.sub("", html_content)
 
-    # Convert HTML to markdown
-    h = html2text.HTML2Text()
-    h.ignore_links = False
-    h.ignore_images = True
-    h.ignore_tables = False
-    markdown_content = h.handle(html_content)
+        # Convert HTML to markdown
+        import html2text
+        h = html2text.HTML2Text()
+        h.ignore_links = False
+        h.ignore_images = True
+        h.ignore_tables = False
+        h.body_width = 0  # Skip the line wrapping pass; the output only feeds the LLM
+        markdown_content = h.handle(html_content)
 
     # Clean up excess newlines
-    markdown_content = re.sub(r"\n{3,}", "\n\n", markdown_content)
+    markdown_content = EXCESS_NEWLINES_RE.sub("\n\n", markdown_content)
     markdown_content = markdown_content.strip()
     
     # Save the markdown content to the cache file
-    with open(filename, "w", encoding="utf-8") as file:
-        file.write(markdown_content)
+    write_cache_file(filename, markdown_content)
     logger.debug(f"Markdown content saved to cache: {filename}")
 
     logger.info(f"Website scraping completed for: {url}")
-    return markdown_content
+    return markdown_content, False
 
 
-def scrape_upwork_data(search_config, num_jobs=20, rate_limit_delay=5):
+def iter_upwork_job_batches(search_config, num_jobs=20, rate_limit_delay=5, batch_size=5):
+    """Scrape Upwork job pages, yielding lists of job dicts as each batch completes"""
     logger.info(f"Scraping Upwork data with config: {search_config}, num_jobs: {num_jobs}")
     
     # Build URL based on search type
@@ -481,51 +804,145 @@ def scrape_upwork_data(search_config, num_jobs=20, rate_limit_delay=5):
         url = f"https://www.upwork.com/nx/search/jobs?ontology_skill_uid={search_config['ontology_skill_uid']}&sort=recency&page=1&per_page={num_jobs}"
     else:
         logger.error(f"Invalid search type: {search_config['type']}")
-        return pd.DataFrame()
-
-    try:
-        markdown_content = scrape_website_to_markdown(url)
-        prompt = SCRAPER_PROMPT_TEMPLATE.format(markdown_content=markdown_content)
-        completion, _ = call_gemini_api(prompt, UpworkJobs)
-        jobs_links_list = [job["link"] for job in completion["jobs"]]
+        return
+
+    # One browser serves the listing page and every job page of this pass
+    with upwork_browser_context() as context:
+        markdown_content = scrape_website_to_markdown(url, context)
+        jobs_links_list = _extract_job_links(markdown_content, num_jobs)
+        if not jobs_links_list:
+            # The listing markup changed; let Gemini find the links
+            prompt = render_scraper_prompt(markdown_content=markdown_content)
+            completion, _ = call_gemini_api(prompt, UpworkJobs)
+            jobs_links_list = [job["link"] for job in completion["jobs"]]
         logger.debug(f"Found {len(jobs_links_list)} job links")
 
-        jobs_data = []
+        jobs_batch = []
+        for num_scraped, job in enumerate(_iter_job_pages(jobs_links_list, rate_limit_delay, context)):
+            # Position across all batches, so batches can be scored independently
+            job['job_id'] = str(num_scraped)
+            jobs_batch.append(job)
+            if len(jobs_batch) >= batch_size:
+                yield jobs_batch
+                jobs_batch = []
+
+        if jobs_batch:
+            yield jobs_batch
+
+
+def _extract_job_links(markdown_content, num_jobs):
+    """Pull unique job page links out of search page markdown, in page order"""
+    links = dict.fromkeys(f"{path}/" for path in JOB_LINK_RE.findall(markdown_content))
+    return list(links)[:num_jobs]
+
+def _iter_job_pages(jobs_links_list, rate_limit_delay, context):
+    """Scrape job pages in order while their Gemini extractions run concurrently, yielding job dicts"""
+    pending = deque()
+    group = []
+    with ThreadPoolExecutor(max_workers=GEMINI_CONCURRENCY) as executor:
         for link in tqdm(jobs_links_list, desc="Scraping job pages"):
+            full_link = f"https://www.upwork.com{link}"
             try:
-                full_link = f"https://www.upwork.com{link}"
-                
-                # Create cache filename using MD5 hash
-                url_hash = hashlib.md5(full_link.encode()).hexdigest()
-                cache_path = os.path.join("./files/cache/search_pages", f"{url_hash}.md")
-                
-                job_page_content = scrape_website_to_markdown(full_link)
-                prompt = SCRAPER_PROMPT_TEMPLATE.format(markdown_content=job_page_content)
-                completion, _ = call_gemini_api(prompt, JobInformation)
-                
-                if isinstance(completion, dict):
-                    # Extract Upwork job ID from URL
-                    job_id_match = re.search(r'_~([^/]+)/', full_link)
-                    if job_id_match:
-                        upwork_id = job_id_match.group(1)
-                        completion['url'] = full_link  # Add the full URL to the job data
-                        completion['apply_url'] = f"https://www.upwork.com/nx/proposals/job/~{upwork_id}/apply/"  # Add apply URL
-                        completion['upwork_id'] = upwork_id  # Store the Upwork ID for matching
-                        logger.debug(f"Extracted Upwork ID: {upwork_id}")
-                    else:
-                        logger.warning(f"Could not extract Upwork ID from URL: {full_link}")
-                    jobs_data.append(completion)
-                    logger.debug(f"Scraped job: {truncate_content(completion.get('title', 'Unknown'))}")
-                else:
-                    logger.error(f"Error: Invalid response from Gemini API for job info: {completion}")
-                
-                # Always add a small delay between jobs to avoid rate limits
-                time.sleep(rate_limit_delay)
-                    
+                # Job details are read from visible text; links are only needed on the search page
+                job_page_content, from_cache = _scrape_page(full_link, context, text_only=True)
             except Exception as e:
                 logger.error(f"Error processing link {link}: {e}")
                 continue  # Skip failed jobs but continue processing others
 
+            group.append((link, full_link, job_page_content))
+            if len(group) >= EXTRACTION_BATCH_SIZE:
+                pending.append(executor.submit(_extract_job_pages, group))
+                group = []
+
+            # Add a small delay between page loads to avoid rate limits; cached pages made no request
+            if not from_cache:
+                time.sleep(rate_limit_delay)
+
+            # Hand back extractions that have already finished, keeping page order
+            while pending and pending[0].done():
+                yield from _collect_job_infos(pending.popleft())
+
+        if group:
+            pending.append(executor.submit(_extract_job_pages, group))
+        while pending:
+            yield from _collect_job_infos(pending.popleft())
+
+
+def _extract_job_pages(group):
+    """
+    Extract JobInformation for a group of scraped pages with one Gemini call,
+    falling back to a call per page for any page the batch answer misses.
+    Returns (link, full_link, completion) tuples in page order.
+    """
+    extracted = {}
+    if len(group) > 1:
+        pages = "\n\n".join(
+            f'<page number="{number}">\n{content}\n</page>'
+            for number, (_, _, content) in enumerate(group, start=1)
+        )
+        try:
+            completion, _ = call_gemini_api(render_scrape_jobs_batch_prompt(pages=pages), JobInformationBatch)
+            jobs = completion.get("jobs", []) if isinstance(completion, dict) else []
+            for job in jobs:
+                if isinstance(job, dict) and job.get("page") in range(1, len(group) + 1):
+                    extracted.setdefault(job.pop("page"), job)
+        except Exception as e:
+            logger.error(f"Error extracting batch of {len(group)} job pages: {e}")
+
+    results = []
+    for number, (link, full_link, content) in enumerate(group, start=1):
+        completion = extracted.get(number)
+        if completion is None:
+            try:
+                completion, _ = call_gemini_api(render_scraper_prompt(markdown_content=content), JobInformation)
+            except Exception as e:
+                logger.error(f"Error processing link {link}: {e}")
+                continue
+        results.append((link, full_link, completion))
+    return results
+
+
+def _collect_job_infos(future):
+    """Yield job dicts from a finished group extraction, skipping invalid results"""
+    try:
+        results = future.result()
+    except Exception as e:
+        logger.error(f"Error extracting job pages: {e}")
+        return
+    for link, full_link, completion in results:
+        job = _collect_job_info(full_link, completion)
+        if job is not None:
+            yield job
+
+
+def _collect_job_info(full_link, completion):
+    """Turn a JobInformation extraction into a job dict, or None if it is invalid"""
+    if not isinstance(completion, dict):
+        logger.error(f"Error: Invalid response from Gemini API for job info: {completion}")
+        return None
+
+    # Extract Upwork job ID from URL
+    job_id_match = UPWORK_ID_RE.search(full_link)
+    if job_id_match:
+        upwork_id = job_id_match.group(1)
+        completion['url'] = full_link  # Add the full URL to the job data
+        completion['apply_url'] = f"https://www.upwork.com/nx/proposals/job/~{upwork_id}/apply/"  # Add apply URL
+        completion['upwork_id'] = upwork_id  # Store the Upwork ID for matching
+        logger.debug(f"Extracted Upwork ID: {upwork_id}")
+    else:
+        logger.warning(f"Could not extract Upwork ID from URL: {full_link}")
+    logger.debug(f"Scraped job: {truncate_content(completion.get('title', 'Unknown'))}")
+    return completion
+
+
+def scrape_upwork_data(search_config, num_jobs=20, rate_limit_delay=5):
+    try:
+        jobs_data = [
+            job
+            for jobs_batch in iter_upwork_job_batches(search_config, num_jobs, rate_limit_delay)
+            for job in jobs_batch
+        ]
+
         if not jobs_data:
             logger.warning("No valid job data was collected")
             return pd.DataFrame()  # Return empty DataFrame if no jobs were scraped
@@ -539,144 +956,145 @@ def scrape_upwork_data(search_config, num_jobs=20, rate_limit_delay=5):
         return pd.DataFrame()  # Return empty DataFrame on error
 
 
-def process_job_info_data(jobs_data):
-    logger.info("Processing job info data")
-    def clean_client_info(text):
-        if pd.isna(text):
-            return text
-
-        cleaned = (
-            text.replace("\n\n", " | ")
-            .replace("\n", " ")
-            .replace("***", "")
-            .replace("**", "")
-            .replace("*", "")
-            .strip()
-        )
+def scrape_and_score_upwork_data(search_config, profile, num_jobs=20, rate_limit_delay=5, batch_size=None):
+    """
+    Scrape and score Upwork jobs as a pipeline: each batch is scored on a
+    worker thread while the next batch of job pages is still being scraped.
+    """
+    # One scrape batch feeds one scoring call, so size it like a scoring batch
+    batch_size = batch_size or SCORE_BATCH_SIZE
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = [
+                executor.submit(score_scaped_jobs, process_job_info_data(jobs_batch), profile)
+                for jobs_batch in iter_upwork_job_batches(
+                    search_config, num_jobs, rate_limit_delay, batch_size
+                )
+            ]
+            scored_batches = [future.result() for future in futures]
 
-        # Remove multiple spaces
-        cleaned = re.sub(r"\s+", " ", cleaned)
-        # Remove multiple separators
-        cleaned = re.sub(r"\|\s*\|", "|", cleaned)
-        # Clean up spaces around separators
-        cleaned = re.sub(r"\s*\|\s*", " | ", cleaned)
+        if not scored_batches:
+            logger.warning("No valid job data was collected")
+            return pd.DataFrame()
 
-        return cleaned.strip()
+        jobs_df = pd.concat(scored_batches, ignore_index=True)
+        # A batch whose scoring failed has no scores; count those jobs as unscored rather than NaN
+        jobs_df["score"] = jobs_df["score"].fillna(0.0) if "score" in jobs_df.columns else 0.0
+        logger.info(f"Upwork data scraping and scoring completed for config: {search_config}")
+        return jobs_df
 
-    jobs_df = pd.DataFrame(jobs_data)
-    # Explicitly create the 'rate' column if it doesn't exist
-    if "rate" not in jobs_df.columns:
-        jobs_df["rate"] = ""
-    jobs_df["rate"] = jobs_df["rate"].astype(str).str.replace(
-        r"\$?(\d+\.?\d*)\s*\n*-\n*\$?(\d+\.?\d*)", r"$\1-$\2", regex=True
+    except Exception as e:
+        logger.error(f"Error scraping Upwork data: {e}")
+        return pd.DataFrame()
+
+
+def _clean_client_info(client_info):
+    """Flatten scraped client information into a single line, column-wise"""
+    cleaned = (
+        client_info.astype(str)
+        .str.replace("\n\n", " | ", regex=False)
+        .str.replace("\n", " ", regex=False)
+        .str.replace(MARKDOWN_STARS_RE, "", regex=True)
+        .str.strip()
     )
-    # Explicitly create the 'client_infomation' column if it doesn't exist
-    if "client_infomation" not in jobs_df.columns:
-        jobs_df["client_infomation"] = ""
-    # Explicitly create the 'experience_level' column if it doesn't exist
-    if "experience_level" not in jobs_df.columns:
-        jobs_df["experience_level"] = ""
-    # Explicitly create the 'duration' column if it doesn't exist
-    if "duration" not in jobs_df.columns:
-        jobs_df["duration"] = ""
+    for pattern, replacement in CLIENT_INFO_PATTERNS:
+        cleaned = cleaned.str.replace(pattern, replacement, regex=True)
+    return cleaned.str.strip()
+
+
+def process_job_info_data(jobs_data):
+    logger.info("Processing job info data")
+    jobs_df = pd.DataFrame(jobs_data)
+    # Explicitly create the optional columns that don't exist, in one reindex
+    missing_columns = [column for column in OPTIONAL_JOB_COLUMNS if column not in jobs_df.columns]
+    if missing_columns:
+        jobs_df = jobs_df.reindex(columns=[*jobs_df.columns, *missing_columns], fill_value="")
+    jobs_df["rate"] = jobs_df["rate"].astype(str).str.replace(RATE_RANGE_RE, r"$\1-$\2", regex=True)
     # Explicitly create the 'job_id' column if it doesn't exist
     if "job_id" not in jobs_df.columns:
         jobs_df["job_id"] = jobs_df.index.astype(str)
-    jobs_df["client_infomation"] = jobs_df["client_infomation"].astype(str).apply(clean_client_info)
+    jobs_df["client_infomation"] = _clean_client_info(jobs_df["client_infomation"])
     logger.info("Job info data processed")
 
     return jobs_df
 
 
-def score_scaped_jobs(jobs_df, profile):
+def _score_jobs_batch(jobs_batch, profile):
+    """Score one batch of jobs with Gemini, returning the valid matches"""
+    # Format jobs data for the prompt
+    formatted_jobs = []
+    for job in jobs_batch:
+        formatted_job = {
+            "id": job["job_id"],
+            "title": job["title"],
+            "details": {
+                "experience_level": job["experience_level"],
+                "job_type": job["job_type"],
+                "duration": job["duration"],
+                "rate": job["rate"],
+                "description": job["description"],
+                "client_infomation": job["client_infomation"]
+            }
+        }
+        formatted_jobs.append(formatted_job)
+
+    # Create the prompt with formatted jobs data
+    score_jobs_prompt = render_score_jobs_prompt(
+        profile=profile,
+        jobs=orjson.dumps(formatted_jobs, option=orjson.OPT_INDENT_2).decode()
+    )
+    logger.debug(f"Processing batch of {len(formatted_jobs)} jobs")
+    
+    valid_matches = []
+    try:
+        completion, _ = call_gemini_api(score_jobs_prompt, JobScores)
+        if isinstance(completion, dict) and "matches" in completion:
+            matches = completion.get("matches", [])
+            if isinstance(matches, list):
+                # Validate each match has required fields
+                for match in matches:
+                    if (isinstance(match, dict) 
+                        and "job_id" in match 
+                        and "score" in match
+                        and isinstance(match["score"], (int, float))
+                        and 1 <= match["score"] <= 10):
+                        valid_matches.append({
+                            "job_id": str(match["job_id"]),
+                            "score": float(match["score"])
+                        })
+                logger.debug(f"Scored {len(valid_matches)} jobs")
+            else:
+                logger.error(f"Error: 'matches' is not a list: {matches}")
+        else:
+            logger.error(f"Error: Invalid response format from Gemini API: {completion}")
+    except Exception as e:
+        logger.error(f"Error scoring jobs batch: {e}")
+    return valid_matches
+
+
+def score_scaped_jobs(jobs_df, profile, batch_size=None):
+    """Score jobs against the profile, sending batch_size jobs per Gemini call"""
     logger.info("Scoring scraped jobs")
+    batch_size = batch_size or SCORE_BATCH_SIZE
     
-    # Convert jobs DataFrame to list of dictionaries
-    jobs_dict_list = []
-    for index, row in jobs_df.iterrows():
-        # Use existing job_id if present, otherwise use index
-        job_id = str(row.get("job_id", index))
-        job_dict = {
-            "job_id": job_id,
-            "title": row.get("title", ""),
-            "experience_level": row.get("experience_level", ""),
-            "job_type": row.get("job_type", ""),
-            "duration": row.get("duration", ""),
-            "rate": row.get("rate", ""),
-            "description": row.get("description", ""),
-            "client_infomation": row.get("client_infomation", "")
-        }
-        jobs_dict_list.append(job_dict)
+    # Convert jobs DataFrame to list of dictionaries, using the index where there is no job_id
+    job_ids = jobs_df["job_id"] if "job_id" in jobs_df.columns else jobs_df.index
+    jobs_dict_list = jobs_df.reindex(columns=SCORED_JOB_FIELDS, fill_value="").to_dict("records")
+    for job_dict, job_id in zip(jobs_dict_list, job_ids):
+        job_dict["job_id"] = str(job_id)
 
-    # Process jobs in batches of 5
-    jobs_list = [jobs_dict_list[i : i + 5] for i in range(0, len(jobs_dict_list), 5)]
+    # A single call covers the common case of one scrape round
+    jobs_list = [jobs_dict_list[i : i + batch_size] for i in range(0, len(jobs_dict_list), batch_size)]
 
-    # Score each batch of jobs
+    # Score the batches concurrently; each Gemini call is network-bound
     jobs_final_score = []
-    for jobs_batch in jobs_list:
-        # Format jobs data for the prompt
-        formatted_jobs = []
-        for job in jobs_batch:
-            formatted_job = {
-                "id": job["job_id"],
-                "title": job["title"],
-                "details": {
-                    "experience_level": job["experience_level"],
-                    "job_type": job["job_type"],
-                    "duration": job["duration"],
-                    "rate": job["rate"],
-                    "description": job["description"],
-                    "client_infomation": job["client_infomation"]
-                }
-            }
-            formatted_jobs.append(formatted_job)
-
-        # Create the prompt with formatted jobs data
-        score_jobs_prompt = SCORE_JOBS_PROMPT_TEMPLATE.format(
-            profile=profile,
-            jobs=json.dumps(formatted_jobs, indent=2)
-        )
-        logger.debug(f"Processing batch of {len(formatted_jobs)} jobs")
-        
-        try:
-            completion, _ = call_gemini_api(score_jobs_prompt, JobScores)
-            if isinstance(completion, dict) and "matches" in completion:
-                matches = completion.get("matches", [])
-                if isinstance(matches, list):
-                    # Validate each match has required fields
-                    valid_matches = []
-                    for match in matches:
-                        if (isinstance(match, dict) 
-                            and "job_id" in match 
-                            and "score" in match
-                            and isinstance(match["score"], (int, float))
-                            and 1 <= match["score"] <= 10):
-                            valid_matches.append({
-                                "job_id": str(match["job_id"]),
-                                "score": float(match["score"])
-                            })
-                    jobs_final_score.extend(valid_matches)
-                    logger.debug(f"Scored {len(valid_matches)} jobs")
-                else:
-                    logger.error(f"Error: 'matches' is not a list: {matches}")
-            else:
-                logger.error(f"Error: Invalid response format from Gemini API: {completion}")
-        except Exception as e:
-            logger.error(f"Error scoring jobs batch: {e}")
-            continue
+    with ThreadPoolExecutor(max_workers=GEMINI_CONCURRENCY) as executor:
+        for valid_matches in executor.map(lambda batch: _score_jobs_batch(batch, profile), jobs_list):
+            jobs_final_score.extend(valid_matches)
 
-    # Create scores DataFrame and merge with jobs_df
+    # Map scores onto jobs_df by job_id; matches already carry str ids and float scores
     if jobs_final_score:
-        scores_df = pd.DataFrame(jobs_final_score)
-        scores_df["job_id"] = scores_df["job_id"].astype(str)  # Ensure job_id is string
-        scores_df["score"] = scores_df["score"].astype(float)  # Ensure score is float64
-        
-        # Create score column if it doesn't exist
-        if "score" not in jobs_df.columns:
-            jobs_df["score"] = 0.0  # Initialize as float
-        
-        # Update scores using job_id mapping
-        score_dict = dict(zip(scores_df["job_id"], scores_df["score"]))
+        score_dict = {match["job_id"]: match["score"] for match in jobs_final_score}
         jobs_df["score"] = jobs_df["job_id"].map(score_dict).fillna(0.0).astype(float)
     
     logger.info("Scoring of scraped jobs completed")
@@ -685,40 +1103,14 @@ def score_scaped_jobs(jobs_df, profile):
 
 def convert_jobs_matched_to_string_list(jobs_matched):
     logger.info("Converting matched jobs to string list")
-    jobs = []
-    for _, row in jobs_matched.iterrows():
-        job = f"Title: {row['title']}\n"
-        job += f"Description:\n{row['description']}\n"
-        jobs.append(job)
+    jobs = [
+        f"Title: {title}\nDescription:\n{description}\n"
+        for title, description in zip(jobs_matched["title"], jobs_matched["description"])
+    ]
     logger.info("Matched jobs converted to string list")
     return jobs
 
 
-def generate_cover_letter(job_desc, profile):
-    logger.info("Generating cover letter")
-    try:
-        logger.debug(f"Job description length: {len(job_desc)}")
-        logger.debug(f"Profile length: {len(profile)}")
-        
-        cover_letter_prompt = GENERATE_COVER_LETTER_PROMPT_TEMPLATE.format(
-            profile=profile, job_description=job_desc
-        )
-        logger.debug("Generated cover letter prompt")
-        
-        completion, _ = call_gemini_api(cover_letter_prompt, CoverLetter)
-        logger.debug(f"Gemini API response: {truncate_content(str(completion))}")
-        
-        if not isinstance(completion, dict) or "letter" not in completion:
-            logger.error(f"Invalid cover letter response format: {completion}")
-            return {"letter": "Error generating cover letter"}
-            
-        logger.info("Cover letter generated successfully")
-        return {"letter": completion["letter"]}
-    except Exception as e:
-        logger.error(f"Error generating cover letter: {truncate_content(str(e))}")
-        return {"letter": f"Error generating cover letter: {str(e)}"}
-
-
 def check_for_challenge(page, timeout=10):
     """Check if we're on a Cloudflare challenge page"""
     logger.info("Checking for Cloudflare challenge...")
@@ -763,7 +1155,8 @@ def solve_challenge(page):
         
         # Solve challenge
         solver = TurnstileSolver(debug=True)
-        result = solver.solve(url=page.url, sitekey=sitekey, headless=False)
+        # Reuse the caller's browser; a second sync_playwright cannot start on this thread
+        result = solver.solve(url=page.url, sitekey=sitekey, context=page.context)
         
         if result.status != "success":
             logger.error("Failed to solve challenge")
@@ -789,14 +1182,14 @@ def solve_challenge(page):
             logger.error("Failed to apply solution")
             return False
             
-        # Wait for navigation
+        # Wait for navigation; returns as soon as the challenge page is gone
         logger.info("Waiting for page to load after solution...")
-        time.sleep(3)  # Give time for form submission
-        
-        # Check if we're past the challenge
-        if "Just a moment..." not in page.title():
+        try:
+            page.wait_for_function("() => !document.title.includes('Just a moment')", timeout=10000)
             logger.info("Successfully bypassed Cloudflare challenge")
             return True
+        except Exception as e:
+            logger.debug(f"Challenge page did not clear: {e}")
             
         logger.warning("Still on challenge page after solution")
         return False
@@ -808,56 +1201,33 @@ def solve_challenge(page):
 def scrape_job_questions(apply_url: str) -> dict:
     """Scrape additional questions from the job application page"""
     logger.info(f"Scraping questions from: {apply_url}")
+    # A posting's questions never change, so a previous scrape is final
+    cache_path = os.path.join(QUESTIONS_CACHE_DIR, f"{url_cache_key(apply_url)}.json")
     try:
-        # Use special handling for apply pages
-        with sync_playwright() as playwright:
-            # Launch browser with anti-detection arguments
-            browser = playwright.chromium.launch(
-                headless=False,  # Show browser for better challenge handling
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-background-networking",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--window-position=2000,2000",
-                ]
-            )
-            
-            # Set up context with realistic user agent
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"
-            )
+        with open(cache_path, "rb") as file:
+            logger.debug(f"Using cached questions: {cache_path}")
+            return {"questions": orjson.loads(file.read())}
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        pass
 
-            # Load and verify authentication cookies
-            cookies = load_cookies()
-            if not cookies:
-                logger.error("No authentication cookies found")
-                return {"questions": []}
-                
-            # Verify required cookies are present
-            required_cookies = [
-                'master_access_token',
-                'oauth2_global_js_token',
-                'XSRF-TOKEN',
-                'console_user',
-                'user_uid',
-                'recognized'
-            ]
-            cookie_names = {cookie['name'] for cookie in cookies}
-            missing_cookies = set(required_cookies) - cookie_names
-            if missing_cookies:
-                logger.error(f"Missing required cookies: {missing_cookies}")
-                return {"questions": []}
-                
-            context.add_cookies(cookies)
-            page = context.new_page()
+    try:
+        # Load and verify authentication cookies
+        cookies = load_cookies()
+        if not cookies:
+            logger.error("No authentication cookies found")
+            return {"questions": []}
             
+        # Verify required cookies are present
+        missing_cookies = REQUIRED_COOKIES.difference(cookie['name'] for cookie in cookies)
+        if missing_cookies:
+            logger.error(f"Missing required cookies: {missing_cookies}")
+            return {"questions": []}
+
+        # Apply pages open in a browser kept alive between calls
+        with _apply_page(cookies) as page:
             # Navigate to apply page with proper error handling
             try:
-                response = page.goto(apply_url, wait_until="networkidle", timeout=30000)
+                response = page.goto(apply_url, wait_until="domcontentloaded", timeout=30000)
                 if response.status == 401 or response.status == 403:
                     logger.error(f"Authentication failed for URL: {apply_url}")
                     return {"questions": []}
@@ -872,11 +1242,8 @@ def scrape_job_questions(apply_url: str) -> dict:
                     logger.error("Failed to bypass Cloudflare challenge")
                     return {"questions": []}
             
-            # Wait for page to fully load and stabilize
-            page.wait_for_load_state("networkidle", timeout=30000)
-            page.wait_for_load_state("domcontentloaded", timeout=30000)
-            
-            # Wait for either questions area or cover letter section
+            # Wait for either questions area or cover letter section; Upwork's
+            # analytics traffic keeps the network from ever going idle
             try:
                 # First wait for the cover letter section which is always present
                 page.wait_for_selector(".air3-card-outline", timeout=15000)
@@ -888,102 +1255,89 @@ def scrape_job_questions(apply_url: str) -> dict:
                     is_visible = questions_area.is_visible()
                     if not is_visible:
                         logger.info("Questions area exists but is hidden (no questions)")
-                        return {"questions": []}
+                        return _cache_questions(cache_path, [])
                         
-                    # Wait for questions to be loaded
-                    questions_area.wait_for(state="visible", timeout=30000)
-                    
                     # Try to find questions with different selectors
                     questions = []
                     
                     # Try direct label elements first since they're more reliable
-                    labels = questions_area.locator(".label")
-                    count = labels.count()
-                    if count > 0:
-                        for i in range(count):
-                            label = labels.nth(i).text_content()
-                            if label:
-                                label = label.strip()
-                                # Skip labels that are part of the cover letter section
-                                if "Cover Letter" not in label and "Attachments" not in label:
-                                    questions.append({
-                                        "text": label,
-                                        "type": "text"  # Default to text type
-                                    })
+                    # One round trip for every label instead of one per question
+                    for label in questions_area.locator(".label").all_text_contents():
+                        label = label.strip()
+                        # Skip labels that are part of the cover letter section
+                        if label and "Cover Letter" not in label and "Attachments" not in label:
+                            questions.append({
+                                "text": label,
+                                "type": "text"  # Default to text type
+                            })
                     
                     logger.info(f"Found {len(questions)} questions using direct extraction")
-                    return {"questions": questions}
+                    return _cache_questions(cache_path, questions)
                 else:
                     logger.info("No questions found in apply page (cover letter only)")
-                    return {"questions": []}
+                    return _cache_questions(cache_path, [])
                     
             except Exception as e:
                 logger.error(f"Error waiting for page elements: {str(e)}")
                 return {"questions": []}
-            
-            # Get full page content as backup
-            html_content = page.content()
-            logger.debug(f"Retrieved content from {apply_url}")
-
-            browser.close()
-
-        # Convert HTML to markdown with special handling for forms
-        h = html2text.HTML2Text()
-        h.ignore_links = False
-        h.ignore_images = True
-        h.ignore_tables = False
-        h.body_width = 0  # Don't wrap lines
-        markdown_content = h.handle(html_content)
 
-        # Save to apply pages cache
-        cache_dir = "./files/cache/apply_pages"
-        os.makedirs(cache_dir, exist_ok=True)
-        url_hash = hashlib.md5(apply_url.encode()).hexdigest()
-        cache_path = os.path.join(cache_dir, f"{url_hash}.md")
-        with open(cache_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
-        logger.debug(f"Apply page content saved to cache: {cache_path}")
-
-        # Extract questions using dedicated prompt
-        prompt = SCRAPE_QUESTIONS_PROMPT_TEMPLATE.format(markdown_content=markdown_content)
-        completion, _ = call_gemini_api(prompt, None)  # Don't use schema validation for questions
-        
-        if isinstance(completion, dict):
-            questions = completion.get("questions", [])
-            logger.debug(f"Found {len(questions)} questions")
-            # Convert to expected format
-            formatted_questions = []
-            for q in questions:
-                if isinstance(q, dict) and "text" in q:
-                    formatted_questions.append({
-                        "text": q["text"],
-                        "type": q.get("type", "text"),
-                        "options": q.get("options", []) if q.get("type") == "multiple_choice" else None
-                    })
-            return {"questions": formatted_questions}
-        else:
-            logger.warning("No questions found in apply page")
-            return {"questions": []}
-            
     except Exception as e:
         logger.error(f"Error scraping questions: {truncate_content(str(e))}")
         return {"questions": []}
 
+def _cache_questions(cache_path, questions):
+    """Store the questions scraped from an apply page and return them in the scraper's format"""
+    try:
+        os.makedirs(QUESTIONS_CACHE_DIR, exist_ok=True)
+        write_cache_file(cache_path, orjson.dumps(questions).decode())
+    except OSError as e:
+        logger.warning(f"Could not write questions cache: {e}")
+    return {"questions": questions}
+
+def _align_answers(answers, num_questions):
+    """Order Gemini's answers like the questions, matching on question_id and by position only as a fallback"""
+    answer_texts = [""] * num_questions
+    unkeyed = []
+    keyed = False
+    for answer in answers:
+        if not isinstance(answer, dict) or "answer" not in answer:
+            logger.error(f"Invalid answer format: {truncate_content(str(answer))}")
+            unkeyed.append("")
+            continue
+        try:
+            index = int(answer.get("question_id"))
+        except (TypeError, ValueError):
+            index = -1
+        if 0 <= index < num_questions:
+            answer_texts[index] = answer["answer"]
+            keyed = True
+        else:
+            unkeyed.append(answer["answer"])
+
+    if not keyed:
+        # Without ids, position is only trustworthy when nothing was dropped or added
+        if len(unkeyed) == num_questions:
+            answer_texts = unkeyed
+        else:
+            logger.warning(f"Got {len(unkeyed)} unmatched answers for {num_questions} questions")
+    elif unkeyed:
+        logger.warning(f"Discarded {len(unkeyed)} answers without a valid question_id")
+    return [{"answer": text} for text in answer_texts]
+
 def generate_question_answers(job_description: str, questions: List[dict]) -> dict:
     """Generate answers for job application questions"""
     logger.info("Generating answers for application questions")
     try:
         # Read background information
-        with open("files/background/technical_experience.md", "r") as f:
-            technical_background = f.read()
-        with open("files/background/work_approach.md", "r") as f:
-            work_approach = f.read()
+        technical_background = read_text_file("files/background/technical_experience.md")
+        work_approach = read_text_file("files/background/work_approach.md")
             
         # Format questions for prompt
         formatted_questions = []
-        for q in questions:
+        for question_id, q in enumerate(questions):
             question_type = q.get("type", "text")
             question_data = {
+                "id": str(question_id),
                 "text": q["text"],
                 "type": question_type
             }
@@ -994,51 +1348,45 @@ def generate_question_answers(job_description: str, questions: List[dict]) -> di
         # Extract just the description if job_description is a dict
         job_desc = job_description["description"] if isinstance(job_description, dict) else job_description
         
-        prompt = ANSWER_QUESTIONS_PROMPT_TEMPLATE.format(
+        prompt = render_answer_questions_prompt(
             job_description=job_desc,
             technical_background=technical_background,
             work_approach=work_approach,
-            questions=json.dumps(formatted_questions, indent=2)
+            questions=orjson.dumps(formatted_questions, option=orjson.OPT_INDENT_2).decode()
         )
         
         completion, _ = call_gemini_api(prompt, None)  # Don't use schema validation for flexibility
         
-        logger.debug(f"Raw completion response: {truncate_content(str(completion))}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw completion response: %s", truncate_content(str(completion)))
         
         # Ensure we have a valid completion object
         if isinstance(completion, str):
             try:
                 # Handle potential markdown code block wrapping
-                if "```json" in completion:
-                    json_str = completion.split("```json")[1].split("```")[0].strip()
+                fence = JSON_FENCE_RE.search(completion)
+                if fence:
+                    json_str = fence.group(1)
                     logger.debug(f"Extracted JSON string: {truncate_content(json_str)}")
-                    completion = json.loads(json_str)
+                    completion = orjson.loads(json_str)
                 else:
-                    completion = json.loads(completion)
-            except json.JSONDecodeError as e:
+                    completion = orjson.loads(completion)
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response: {e}")
                 logger.debug(f"Failed JSON content: {truncate_content(str(completion))}")
                 return {"answers": []}
 
         if isinstance(completion, dict):
             answers = completion.get("answers", [])
-            logger.debug(f"Extracted answers: {truncate_content(str(answers))}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Extracted answers: {truncate_content(str(answers))}")
             
             if not answers:
                 logger.error("No answers found in response")
                 return {"answers": []}
                 
-            # Validate and format each answer
-            formatted_answers = []
-            for answer in answers:
-                logger.debug(f"Processing answer: {truncate_content(str(answer))}")
-                
-                if isinstance(answer, dict) and "answer" in answer:
-                    formatted_answers.append({"answer": answer["answer"]})
-                else:
-                    logger.error(f"Invalid answer format: {truncate_content(str(answer))}")
-            
-            if formatted_answers:
+            formatted_answers = _align_answers(answers, len(questions))
+            if any(answer["answer"] for answer in formatted_answers):
                 logger.debug(f"Generated {len(formatted_answers)} answers")
                 return {"answers": formatted_answers}
             
@@ -1049,42 +1397,58 @@ def generate_question_answers(job_description: str, questions: List[dict]) -> di
         logger.error(f"Error generating answers: {truncate_content(str(e))}")
         return {"answers": []}
 
-def generate_interview_script_content(job_desc):
-    logger.info("Generating interview script content")
+
+def generate_application_bundle(job_desc, profile):
+    """Generate the cover letter and the call script for a job in a single Gemini call"""
+    logger.info("Generating cover letter and interview script")
     try:
         logger.debug(f"Job description length: {len(job_desc)}")
-        
-        # Read background information
-        with open("files/background/technical_experience.md", "r") as f:
-            technical_background = f.read()
-        with open("files/background/work_approach.md", "r") as f:
-            work_approach = f.read()
-        
-        call_script_writer_prompt = GENERATE_CALL_SCRIPT_PROMPT_TEMPLATE.format(
+
+        bundle_prompt = render_application_bundle_prompt(
+            profile=profile,
             job_description=job_desc,
-            technical_background=technical_background,
-            work_approach=work_approach
+            technical_background=read_text_file("files/background/technical_experience.md"),
+            work_approach=read_text_file("files/background/work_approach.md")
         )
-        logger.debug("Generated interview script prompt")
-        
-        completion, _ = call_gemini_api(call_script_writer_prompt, CallScript)
-        logger.debug(f"Gemini API response: {truncate_content(str(completion))}")
-        
-        if not isinstance(completion, dict) or "script" not in completion:
-            logger.error(f"Invalid interview script response format: {completion}")
-            return {"script": "Error generating interview script"}
-            
-        logger.info("Interview script generated successfully")
-        return {"script": completion["script"]}
+
+        completion, _ = call_gemini_api(bundle_prompt, ApplicationBundle)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Gemini API response: %s", truncate_content(str(completion)))
+
+        if not isinstance(completion, dict) or "letter" not in completion or "script" not in completion:
+            logger.error(f"Invalid application bundle response format: {completion}")
+            return {"letter": "Error generating cover letter", "script": "Error generating interview script"}
+
+        logger.info("Cover letter and interview script generated successfully")
+        return {"letter": completion["letter"], "script": completion["script"]}
     except Exception as e:
-        logger.error(f"Error generating interview script: {truncate_content(str(e))}")
-        return {"script": f"Error generating interview script: {str(e)}"}
+        logger.error(f"Error generating application bundle: {truncate_content(str(e))}")
+        return {
+            "letter": f"Error generating cover letter: {str(e)}",
+            "script": f"Error generating interview script: {str(e)}"
+        }
 
 
 def save_scraped_jobs_to_csv(scraped_jobs_df):
     logger.info("Saving scraped jobs to CSV")
+    if scraped_jobs_df.empty:
+        # An empty frame would fix the day's header (or leave a blank file) with no rows to show for it
+        logger.info("No scraped jobs to save")
+        return
     os.makedirs(SCRAPED_JOBS_FOLDER, exist_ok=True)
     date_str = datetime.now().strftime("%Y-%m-%d")
     filename = f"{SCRAPED_JOBS_FOLDER}scraped_jobs_{date_str}.csv"
-    scraped_jobs_df.to_csv(filename, index=False)
+    try:
+        columns = pd.read_csv(filename, nrows=0).columns
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        columns = None
+    if columns is None:
+        write_cache_file(filename, scraped_jobs_df.to_csv(index=False))
+    elif scraped_jobs_df.columns.difference(columns).empty:
+        # Every column already has a place in the day's header, so only the new rows are written
+        scraped_jobs_df.reindex(columns=columns).to_csv(filename, index=False, mode="a", header=False)
+    else:
+        # New columns (e.g. score) widen the header; rewrite the day's file with the union
+        combined = pd.concat([pd.read_csv(filename), scraped_jobs_df], ignore_index=True)
+        write_cache_file(filename, combined.to_csv(index=False))
     logger.info(f"Scraped jobs saved to CSV: {filename}")
@@ -106,6 +106,22 @@ def test_get_unprocessed_jobs(job_tracker):
     assert len(unprocessed) == 1
     assert "job2" in unprocessed
 
+def test_mark_jobs_seen_and_processed_batch(job_tracker):
+    """Test marking several jobs in one call"""
+    job_ids = job_tracker.mark_jobs_seen([
+        {"upwork_id": "job1", "title": "First"},
+        {"upwork_id": "job2", "title": "Second"},
+        {"title": "No ID", "description": "Same description"},
+        {"title": "No ID again", "description": "Same description"}
+    ])
+    assert job_ids[:2] == ["job1", "job2"]
+    # Jobs without an Upwork ID are deduplicated by description within the batch
+    assert job_ids[2] == job_ids[3]
+
+    job_tracker.mark_jobs_processed({"job1": {"result": "a"}, "job2": {"result": "b"}})
+    unprocessed = job_tracker.get_unprocessed_jobs()
+    assert list(unprocessed) == [job_ids[2]]
+
 def test_cleanup_old_jobs(job_tracker):
     """Test cleaning up old jobs"""
     # Add some jobs with old timestamps
@@ -124,16 +140,14 @@ def test_cleanup_old_jobs(job_tracker):
     assert "old_job" not in remaining_jobs
     assert "new_job" in remaining_jobs
 
-@patch('src.continuous_poller.scrape_upwork_data')
-@patch('src.continuous_poller.generate_cover_letter')
-@patch('src.continuous_poller.generate_interview_script_content')
-@patch('requests.post')
-def test_upwork_poller(mock_post, mock_script, mock_letter, mock_scrape, sample_jobs_df, job_tracker, health_check_port):
+@patch('src.continuous_poller.scrape_and_score_upwork_data')
+@patch('src.continuous_poller.generate_application_bundle')
+@patch('requests.Session.post')
+def test_upwork_poller(mock_post, mock_bundle, mock_scrape, sample_jobs_df, job_tracker, health_check_port):
     """Test the UpworkPoller class"""
     # Setup mocks
     mock_scrape.return_value = sample_jobs_df
-    mock_letter.return_value = {"letter": "Test cover letter"}
-    mock_script.return_value = {"script": "Test interview script"}
+    mock_bundle.return_value = {"letter": "Test cover letter", "script": "Test interview script"}
     mock_post.return_value.status_code = 200
     
     # Create poller with test configuration
@@ -191,10 +205,10 @@ def test_upwork_poller(mock_post, mock_script, mock_letter, mock_scrape, sample_
 
 def test_error_handling(job_tracker, health_check_port):
     """Test error handling in job processing"""
-    with patch('src.continuous_poller.generate_cover_letter') as mock_letter, \
+    with patch('src.continuous_poller.generate_application_bundle') as mock_bundle, \
          patch('src.health_check.HTTPServer') as mock_server:
         # Simulate an error
-        mock_letter.side_effect = Exception("Test error")
+        mock_bundle.side_effect = Exception("Test error")
         
         poller = UpworkPoller(
             search_query="test",
@@ -259,7 +273,7 @@ def test_cleanup_scheduling(job_tracker, health_check_port):
             if hasattr(poller, 'health_server'):
                 poller.health_server.shutdown()
 
-@patch('src.continuous_poller.scrape_upwork_data')
+@patch('src.continuous_poller.scrape_and_score_upwork_data')
 def test_main_polling_loop(mock_scrape, job_tracker, sample_jobs_df, health_check_port):
     """Test the main polling loop"""
     mock_scrape.return_value = sample_jobs_df
@@ -356,7 +370,7 @@ def test_health_check(health_check_port):
 
 def test_webhook_notification():
     """Test webhook notification for high-value jobs"""
-    with patch('requests.post') as mock_post, \
+    with patch('requests.Session.post') as mock_post, \
          patch('src.health_check.HTTPServer') as mock_server:
         mock_post.return_value.status_code = 200
         
@@ -0,0 +1,3 @@
+"""
+Fixture data for the test suite.
+"""
@@ -1,12 +1,33 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 import pandas as pd
+from types import MappingProxyType
+from importlib.resources import files
+import src.graph as graph_module
 from src.graph import UpworkAutomation
 
-@pytest.fixture
+# Resolved through the package rather than the working directory
+_PROFILE = files("tests.test_data").joinpath("test_profile.md").read_text(encoding="utf-8")
+
+# Column dtypes of a scored jobs frame: the graph's string columns plus a float score
+_SCORED_DTYPES = {**dict.fromkeys(graph_module.JOB_COLUMNS, graph_module.STRING_DTYPE), "score": "float64"}
+
+# Default graph state; tests override only the fields they exercise
+_BASE_STATE = MappingProxyType({
+    "job_title": "",
+    "scraped_jobs_df": pd.DataFrame(),
+    "matches": [],
+    "job_description": "",
+    "cover_letter": "",
+    "call_script": "",
+    "num_matches": 0,
+})
+
+@pytest.fixture(scope="session")
 def sample_jobs_df():
-    """Create a sample jobs DataFrame for testing"""
-    return pd.DataFrame([
+    """Create a sample jobs DataFrame for testing, shared read-only across tests"""
+    # Plain object columns, as scrape_upwork_data returns them before the graph casts them
+    return pd.DataFrame.from_records([
         {
             "job_id": "123",
             "title": "AI Developer",
@@ -17,23 +38,17 @@ def sample_jobs_df():
             "rate": "$50-70/hr",
             "client_infomation": "Test client info"
         }
-    ], columns=[
-        "job_id",
-        "title",
-        "description",
-        "job_type",
-        "experience_level",
-        "duration",
-        "rate",
-        "client_infomation"
     ])
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def automation():
-    """Create a UpworkAutomation instance for testing"""
-    with open("tests/test_data/test_profile.md", "r") as f:
-        profile = f.read()
-    return UpworkAutomation(profile=profile, num_jobs=5)
+    """Create a UpworkAutomation instance for testing, shared across tests"""
+    return UpworkAutomation(profile=_PROFILE, num_jobs=5)
+
+@pytest.fixture(scope="session")
+def app_content_dir(tmp_path_factory):
+    """Create one temporary directory for the saved application files of all tests"""
+    return tmp_path_factory.mktemp("app_content")
 
 def test_graph_initialization(automation):
     """Test that the graph is initialized correctly"""
@@ -41,21 +56,13 @@ def test_graph_initialization(automation):
     assert automation.profile is not None
     assert automation.number_of_jobs == 5
 
-@patch('src.utils.scrape_upwork_data')
-def test_scrape_upwork_jobs(mock_scrape, automation, sample_jobs_df):
-    """Test job scraping functionality"""
-    # Test with valid job title
+@pytest.mark.parametrize("job_title", ["test", ""])
+@patch.object(graph_module, 'scrape_upwork_data')
+def test_scrape_upwork_jobs(mock_scrape, job_title, automation, sample_jobs_df):
+    """Test job scraping functionality, with and without a job title"""
     mock_scrape.return_value = sample_jobs_df.copy()
     
-    initial_state = {
-        "job_title": "test",
-        "scraped_jobs_df": pd.DataFrame(),
-        "matches": [],
-        "job_description": "",
-        "cover_letter": "",
-        "call_script": "",
-        "num_matches": 0
-    }
+    initial_state = {**_BASE_STATE, "job_title": job_title}
     
     result = automation.scrape_upwork_jobs(initial_state)
     
@@ -68,39 +75,38 @@ def test_scrape_upwork_jobs(mock_scrape, automation, sample_jobs_df):
     assert "call_script" in result
     assert "num_matches" in result
     
-    # Verify content is correct
-    assert isinstance(result["scraped_jobs_df"], pd.DataFrame)
-    assert len(result["scraped_jobs_df"]) == len(sample_jobs_df)
-    pd.testing.assert_frame_equal(result["scraped_jobs_df"], sample_jobs_df)
-    
-    # Verify mock was called correctly
-    mock_scrape.assert_called_once_with("test", automation.number_of_jobs)
-    
-    # Test with empty job title
-    empty_state = {
-        "job_title": "",
-        "scraped_jobs_df": pd.DataFrame(),
-        "matches": [],
-        "job_description": "",
-        "cover_letter": "",
-        "call_script": "",
-        "num_matches": 0
-    }
-    
-    empty_result = automation.scrape_upwork_jobs(empty_state)
-    
-    # Verify empty state is handled correctly
-    assert isinstance(empty_result["scraped_jobs_df"], pd.DataFrame)
-    assert empty_result["scraped_jobs_df"].empty
-    assert mock_scrape.call_count == 1  # Should not be called again
+    if job_title:
+        # Verify content is correct
+        pd.testing.assert_frame_equal(
+            result["scraped_jobs_df"], sample_jobs_df.astype("string[pyarrow]"), check_exact=True
+        )
+        mock_scrape.assert_called_once_with(job_title, automation.number_of_jobs)
+    else:
+        # Without a job title nothing is scraped
+        assert isinstance(result["scraped_jobs_df"], pd.DataFrame)
+        assert result["scraped_jobs_df"].empty
+        mock_scrape.assert_not_called()
+
+@patch.object(graph_module, 'scrape_upwork_data')
+def test_scrape_upwork_jobs_fills_missing_fields(mock_scrape, automation, sample_jobs_df):
+    """Test that missing job fields become empty strings rather than pd.NA"""
+    mock_scrape.return_value = sample_jobs_df.drop(columns=["rate"]).assign(duration=None)
+    
+    result = automation.scrape_upwork_jobs({**_BASE_STATE, "job_title": "test"})
+    
+    jobs_df = result["scraped_jobs_df"]
+    assert list(jobs_df.columns) == graph_module.JOB_COLUMNS
+    assert not jobs_df.isna().any().any()
+    assert jobs_df.loc[0, "rate"] == ""
+    assert jobs_df.loc[0, "duration"] == ""
 
-@patch('src.utils.score_scaped_jobs')
-@patch('src.utils.convert_jobs_matched_to_string_list')
-def test_score_scraped_jobs(mock_convert, mock_score, automation, sample_jobs_df):
-    """Test job scoring functionality"""
-    # Test with jobs to score
+@pytest.mark.parametrize("has_jobs", [True, False])
+@patch.object(graph_module, 'score_scaped_jobs')
+@patch.object(graph_module, 'convert_jobs_matched_to_string_list')
+def test_score_scraped_jobs(mock_convert, mock_score, has_jobs, automation, sample_jobs_df):
+    """Test job scoring functionality, with and without scraped jobs"""
     # Create scored DataFrame with expected columns
-    scored_df = pd.DataFrame([{
+    scored_df = pd.DataFrame.from_records([{
         "job_id": "123",
         "title": "AI Developer",
         "description": "Test job description",
@@ -110,151 +116,85 @@ def test_score_scraped_jobs(mock_convert, mock_score, automation, sample_jobs_df
         "rate": "$50-70/hr",
         "client_infomation": "Test client info",
         "score": 8.0  # Score >= 7 for matching
-    }], columns=[
-        "job_id",
-        "title",
-        "description",
-        "job_type",
-        "experience_level",
-        "duration",
-        "rate",
-        "client_infomation",
-        "score"
-    ])
+    }]).astype(_SCORED_DTYPES)
     mock_score.return_value = scored_df
     mock_convert.return_value = ["Test job match"]
     
-    initial_state = {
-        "job_title": "test",
-        "scraped_jobs_df": sample_jobs_df,
-        "matches": [],
-        "job_description": "",
-        "cover_letter": "",
-        "call_script": "",
-        "num_matches": 0
-    }
+    jobs_df = sample_jobs_df if has_jobs else pd.DataFrame()
+    initial_state = {**_BASE_STATE, "job_title": "test", "scraped_jobs_df": jobs_df}
     
     result = automation.score_scraped_jobs(initial_state)
     
     assert "scraped_jobs_df" in result
     assert "matches" in result
     assert "num_matches" in result
-    assert len(result["matches"]) == 1
-    assert result["num_matches"] == 1
-    pd.testing.assert_frame_equal(result["scraped_jobs_df"], scored_df)
-    assert result["matches"] == ["Test job match"]
-    
-    # Test with empty DataFrame
-    empty_state = {
-        "job_title": "test",
-        "scraped_jobs_df": pd.DataFrame(),
-        "matches": [],
-        "job_description": "",
-        "cover_letter": "",
-        "call_script": "",
-        "num_matches": 0
-    }
-    
-    empty_result = automation.score_scraped_jobs(empty_state)
     
-    assert "scraped_jobs_df" in empty_result
-    assert "matches" in empty_result
-    assert "num_matches" in empty_result
-    assert len(empty_result["matches"]) == 0
-    assert empty_result["num_matches"] == 0
-    assert empty_result["matches"] == []
+    if has_jobs:
+        assert result["num_matches"] == 1
+        pd.testing.assert_frame_equal(result["scraped_jobs_df"], scored_df, check_dtype=False, check_exact=True)
+        assert result["matches"] == ["Test job match"]
+    else:
+        # An empty DataFrame short-circuits before scoring
+        assert result["num_matches"] == 0
+        assert result["matches"] == []
+        mock_score.assert_not_called()
 
 def test_need_to_process_matches(automation):
     """Test match processing decision logic"""
     # Test with matches
     initial_state = {
+        **_BASE_STATE,
         "job_title": "test",
-        "scraped_jobs_df": pd.DataFrame(),
         "matches": ["job1", "job2"],
-        "job_description": "",
-        "cover_letter": "",
-        "call_script": "",
-        "num_matches": 2
+        "num_matches": 2,
     }
     result = automation.need_to_process_matches(initial_state)
     assert result == "Process jobs"
     
     # Test without matches
-    empty_state = {
-        "job_title": "test",
-        "scraped_jobs_df": pd.DataFrame(),
-        "matches": [],
-        "job_description": "",
-        "cover_letter": "",
-        "call_script": "",
-        "num_matches": 0
-    }
+    empty_state = {**_BASE_STATE, "job_title": "test"}
     result = automation.need_to_process_matches(empty_state)
     assert result == "No matches"
     
     # Test edge case with None matches
-    none_state = {
-        "job_title": "test",
-        "scraped_jobs_df": pd.DataFrame(),
-        "matches": None,
-        "job_description": "",
-        "cover_letter": "",
-        "call_script": "",
-        "num_matches": 0
-    }
+    none_state = {**_BASE_STATE, "job_title": "test", "matches": None}
     result = automation.need_to_process_matches(none_state)
     assert result == "No matches"
 
-@patch('src.utils.generate_cover_letter')
-def test_generate_cover_letter(mock_generate, automation):
-    """Test cover letter generation"""
-    mock_generate.return_value = {"letter": "Hello, I'm excited about this opportunity... Best, Aymen"}
+@patch.object(graph_module, 'generate_application_bundle')
+def test_generate_job_application_content(mock_generate, automation):
+    """Test that every match's documents are generated up front and reused"""
+    mock_generate.side_effect = lambda job, profile: {"letter": f"Hello, {job}", "script": f"# Introduction\n{job}"}
     
-    initial_state = {
-        "job_title": "test",
-        "scraped_jobs_df": pd.DataFrame(),
-        "matches": ["Test job description"],
-        "job_description": "",
-        "cover_letter": "",
-        "call_script": "",
-        "num_matches": 1
-    }
-    
-    result = automation.generate_cover_letter(initial_state)
+    initial_state = {**_BASE_STATE, "job_title": "test", "matches": ["Job A", "Job B"], "num_matches": 2}
     
-    # Verify state is maintained and updated correctly
-    assert "job_title" in result
-    assert "scraped_jobs_df" in result
-    assert "matches" in result
-    assert "job_description" in result
-    assert "cover_letter" in result
-    assert "call_script" in result
-    assert "num_matches" in result
+    result = automation.generate_job_application_content(initial_state)
     
-    # Verify content is correct
-    assert result["job_description"] == "Test job description"
-    assert result["cover_letter"].startswith("Hello")
-    assert result["cover_letter"].endswith("Best, Aymen")
+    assert set(result["bundles"]) == {"Job A", "Job B"}
+    assert mock_generate.call_count == 2
     
-    # Verify mock was called correctly
-    mock_generate.assert_called_once_with("Test job description", automation.profile)
+    # The per-job node serves the current match from the pre-generated bundles
+    result = automation.generate_cover_letter_and_script(result)
+    assert result["cover_letter"] == "Hello, Job B"
+    assert result["call_script"] == "# Introduction\nJob B"
+    assert mock_generate.call_count == 2
 
-@patch('src.utils.generate_interview_script_content')
-def test_generate_interview_script_content(mock_generate, automation):
-    """Test interview script generation"""
-    mock_generate.return_value = {"script": "# Introduction\nHi [Client Name]...\n\n# Key Points\n...\n\n# Client Questions\n...\n\n# Questions to Ask\n..."}
+@patch.object(graph_module, 'generate_application_bundle')
+def test_generate_cover_letter_and_script(mock_generate, automation):
+    """Test cover letter and interview script generation"""
+    mock_generate.return_value = {
+        "letter": "Hello, I'm excited about this opportunity... Best, Aymen",
+        "script": "# Introduction\nHi [Client Name]...\n\n# Key Points\n...\n\n# Client Questions\n...\n\n# Questions to Ask\n..."
+    }
     
     initial_state = {
+        **_BASE_STATE,
         "job_title": "test",
-        "scraped_jobs_df": pd.DataFrame(),
         "matches": ["Test job description"],
-        "job_description": "Test job description",
-        "cover_letter": "Test cover letter",
-        "call_script": "",
-        "num_matches": 1
+        "num_matches": 1,
     }
     
-    result = automation.generate_interview_script_content(initial_state)
+    result = automation.generate_cover_letter_and_script(initial_state)
     
     # Verify state is maintained and updated correctly
     assert "job_title" in result
@@ -266,30 +206,31 @@ def test_generate_interview_script_content(mock_generate, automation):
     assert "num_matches" in result
     
     # Verify content is correct
+    assert result["job_description"] == "Test job description"
+    assert result["cover_letter"].startswith("Hello")
+    assert result["cover_letter"].endswith("Best, Aymen")
     assert "# Introduction" in result["call_script"]
     assert "# Key Points" in result["call_script"]
     assert "# Client Questions" in result["call_script"]
     assert "# Questions to Ask" in result["call_script"]
-    assert result["job_description"] == "Test job description"
-    assert result["cover_letter"] == "Test cover letter"
     
-    # Verify mock was called correctly
-    mock_generate.assert_called_once_with("Test job description")
+    # Verify a single call produced both documents
+    mock_generate.assert_called_once_with("Test job description", automation.profile)
 
-def test_save_job_application_content(automation, tmp_path, monkeypatch):
+def test_save_job_application_content(automation, app_content_dir, monkeypatch):
     """Test saving job application content"""
     # Set up test file path
-    test_file = tmp_path / "cover_letter.txt"
-    monkeypatch.setattr("src.graph.COVER_LETTERS_FILE", str(test_file))
+    test_file = app_content_dir / "cover_letter_save.txt"
+    monkeypatch.setattr(graph_module, "COVER_LETTERS_FILE", str(test_file))
     
     initial_state = {
+        **_BASE_STATE,
         "job_title": "test",
-        "scraped_jobs_df": pd.DataFrame(),
         "matches": ["remaining job"],
         "job_description": "Test job description",
         "cover_letter": "Test cover letter",
         "call_script": "Test interview script",
-        "num_matches": 1
+        "num_matches": 1,
     }
     
     result = automation.save_job_application_content(initial_state)
@@ -321,39 +262,57 @@ def test_save_job_application_content(automation, tmp_path, monkeypatch):
     assert result["cover_letter"] == "Test cover letter"
     assert result["call_script"] == "Test interview script"
 
-@patch('src.utils.scrape_upwork_data')
-@patch('src.utils.score_scaped_jobs')
-@patch('src.utils.convert_jobs_matched_to_string_list')
-@patch('src.utils.generate_cover_letter')
-@patch('src.utils.generate_interview_script_content')
-def test_full_workflow(
-    mock_script,
-    mock_letter,
-    mock_convert,
-    mock_score,
-    mock_scrape,
-    automation,
-    sample_jobs_df,
-    tmp_path,
-    monkeypatch
-):
+@patch.multiple(
+    graph_module,
+    scrape_upwork_data=DEFAULT,
+    score_scaped_jobs=DEFAULT,
+    convert_jobs_matched_to_string_list=DEFAULT,
+    generate_application_bundle=DEFAULT,
+    save_scraped_jobs_to_csv=DEFAULT,
+)
+def test_full_workflow(automation, sample_jobs_df, app_content_dir, monkeypatch, **mocks):
     """Test the full workflow end-to-end"""
     # Setup mocks
-    mock_scrape.return_value = sample_jobs_df
+    mock_scrape = mocks["scrape_upwork_data"]
+    mock_score = mocks["score_scaped_jobs"]
+    mock_convert = mocks["convert_jobs_matched_to_string_list"]
+    mock_bundle = mocks["generate_application_bundle"]
+    mock_scrape.return_value = sample_jobs_df.copy()
     scored_df = sample_jobs_df.copy()
     scored_df["score"] = [8.0]  # Score >= 7 for matching
     mock_score.return_value = scored_df
     mock_convert.return_value = ["Test job match"]
     # Ensure mocks return dictionaries with expected structure
-    mock_letter.return_value = {"letter": "Hello, I'm excited about this opportunity... Best, Aymen"}
-    mock_script.return_value = {"script": "# Introduction\nHi [Client Name]...\n\n# Key Points\n...\n\n# Client Questions\n...\n\n# Questions to Ask\n..."}
+    mock_bundle.return_value = {
+        "letter": "Hello, I'm excited about this opportunity... Best, Aymen",
+        "script": "# Introduction\nHi [Client Name]...\n\n# Key Points\n...\n\n# Client Questions\n...\n\n# Questions to Ask\n..."
+    }
     
     # Set up test file path
-    test_file = tmp_path / "cover_letter.txt"
-    monkeypatch.setattr("src.graph.COVER_LETTERS_FILE", str(test_file))
-    
-    # Run the workflow
-    final_state = automation.run(job_title="test")
+    test_file = app_content_dir / "cover_letter_full.txt"
+    monkeypatch.setattr(graph_module, "COVER_LETTERS_FILE", str(test_file))
+    
+    # Run the workflow, recording each node and the state it produced
+    steps = automation.graph.stream(
+        automation._initial_state("test"), automation._run_config(), stream_mode="updates"
+    )
+    trace = [item for step in steps for item in step.items()]
+    node_names = [name for name, _ in trace]
+    final_state = trace[-1][1]
+    
+    # Verify the single match went through every step once, in order
+    assert node_names == [
+        "scrape_upwork_jobs",
+        "score_scraped_jobs",
+        "check_for_job_matches",
+        "generate_job_application_content",
+        "generate_cover_letter_and_script",
+        "scrape_application_questions",
+        "generate_question_answers",
+        "save_job_application_content",
+        "check_for_job_matches",
+    ]
+    assert final_state["matches"] == []
     
     # Verify state was properly maintained
     assert "job_title" in final_state
@@ -378,12 +337,15 @@ def test_full_workflow(
     mock_scrape.assert_called_once()
     mock_score.assert_called_once()
     mock_convert.assert_called_once()
-    mock_letter.assert_called_once()
-    mock_script.assert_called_once()
+    mock_bundle.assert_called_once()
+    mocks["save_scraped_jobs_to_csv"].assert_called_once()
     
     # Verify mock calls received correct state
     mock_scrape.assert_called_with("test", automation.number_of_jobs)
-    mock_score.assert_called_with(sample_jobs_df, automation.profile)
+    # The scorer receives the frame after the scrape node's string cast
+    scored_input, scored_profile = mock_score.call_args.args
+    pd.testing.assert_frame_equal(scored_input, sample_jobs_df.astype(graph_module.STRING_DTYPE))
+    assert scored_profile == automation.profile
 
 if __name__ == '__main__':
     pytest.main([__file__])